@@ -181,6 +181,11 @@ class Options:
         "--html",
         help="Display the table as HTML in the browser.",
     )
+    json_output = typer.Option(
+        False,
+        "--json-output",
+        help="Print the data as JSON instead of a table.",
+    )
     wait_for_inclusion = typer.Option(
         True, help="If `True`, waits until the transaction is included in a block."
     )
@@ -2110,11 +2115,13 @@ class CLIManager:
         self.verbosity_handler(quiet, verbose)
 
         if ss58_addresses:
-            valid_ss58s = [
-                ss58 for ss58 in set(ss58_addresses) if is_valid_ss58_address(ss58)
-            ]
-
-            invalid_ss58s = set(ss58_addresses) - set(valid_ss58s)
+            # partition the unique addresses in a single pass
+            valid_ss58s, invalid_ss58s = [], []
+            for ss58 in set(ss58_addresses):
+                if is_valid_ss58_address(ss58):
+                    valid_ss58s.append(ss58)
+                else:
+                    invalid_ss58s.append(ss58)
             for invalid_ss58 in invalid_ss58s:
                 print_error(f"Incorrect ss58 address: {invalid_ss58}. Skipping.")
 
@@ -2556,6 +2563,7 @@ class CLIManager:
         ),
         reuse_last: bool = Options.reuse_last,
         html_output: bool = Options.html_output,
+        json_output: bool = Options.json_output,
         quiet: bool = Options.quiet,
         verbose: bool = Options.verbose,
     ):
@@ -2587,6 +2595,7 @@ class CLIManager:
                 reuse_last,
                 html_output,
                 not self.config.get("use_cache", True),
+                json_output,
             )
         )
 
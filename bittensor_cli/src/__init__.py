@@ -111,6 +111,10 @@ class Defaults:
         hotkey = "default"
         path = "~/.jungoai/wallets/"
 
+    class delegates:
+        cache_path = "~/.jungoai/delegates.json"
+        cache_ttl = 300  # seconds
+
     class logging:
         debug = False
         trace = False
@@ -1,7 +1,7 @@
 import asyncio
 import json
 import random
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
 from dataclasses import dataclass
 from hashlib import blake2b
 from typing import Optional, Any, Union, Callable, Awaitable, cast, TYPE_CHECKING
@@ -157,11 +157,9 @@ class ExtrinsicReceipt:
             if await self.extrinsic_idx is None:
                 await self.retrieve_extrinsic()
 
-            self.__triggered_events = []
-
-            for event in await self.substrate.get_events(block_hash=self.block_hash):
-                if event["extrinsic_idx"] == await self.extrinsic_idx:
-                    self.__triggered_events.append(event)
+            self.__triggered_events = await self.substrate.get_events(
+                block_hash=self.block_hash, extrinsic_idx=await self.extrinsic_idx
+            )
 
         return cast(list, self.__triggered_events)
 
@@ -449,6 +447,47 @@ class RuntimeCache:
             return None
 
 
+class QueryCache:
+    """
+    LRU cache of storage query results, keyed by (module, storage_function, params, block_hash). Only results
+    queried at a specific block hash are stored, as those never change.
+    """
+
+    def __init__(self, maxsize: int = 2048):
+        self.maxsize = maxsize
+        self._items: OrderedDict[tuple, Any] = OrderedDict()
+
+    @staticmethod
+    def make_key(
+        module: str,
+        storage_function: str,
+        params: Optional[list],
+        block_hash: Optional[str],
+    ) -> Optional[tuple]:
+        if not block_hash:
+            return None
+        key = (module, storage_function, tuple(params or ()), block_hash)
+        try:
+            hash(key)
+        except TypeError:
+            # unhashable params (e.g. nested lists) are simply not cached
+            return None
+        return key
+
+    def retrieve(self, key: tuple) -> Optional[Any]:
+        try:
+            self._items.move_to_end(key)
+        except KeyError:
+            return None
+        return self._items[key]
+
+    def add_item(self, key: tuple, value: Any):
+        self._items[key] = value
+        self._items.move_to_end(key)
+        if len(self._items) > self.maxsize:
+            self._items.popitem(last=False)
+
+
 class Runtime:
     block_hash: str
     block_id: int
@@ -459,7 +498,6 @@ class Runtime:
     type_registry_preset = None
 
     def __init__(self, chain, runtime_config, metadata, type_registry):
-        self.runtime_config = RuntimeConfigurationObject()
         self.config = {}
         self.chain = chain
         self.type_registry = type_registry
@@ -644,6 +682,8 @@ class Websocket:
         self._exit_task = None
         self._open_subscriptions = 0
         self._options = options if options else {}
+        # ids sent in batch requests which have not been answered yet
+        self._pending_batch_ids: set[int] = set()
 
     async def __aenter__(self):
         async with self._lock:
@@ -670,6 +710,7 @@ class Websocket:
             if self._in_use == 0 and self.ws is not None:
                 self.id = 0
                 self._open_subscriptions = 0
+                self._pending_batch_ids.clear()
                 self._exit_task = asyncio.create_task(self._exit_with_timer())
 
     async def _exit_with_timer(self):
@@ -695,18 +736,41 @@ class Websocket:
             self._initialized = False
             self._receiving_task = None
             self.id = 0
+            self._pending_batch_ids.clear()
 
     async def _recv(self) -> None:
         try:
             response = json.loads(await self.ws.recv())
+            # batch requests are answered with a single array of responses
+            responses = response if isinstance(response, list) else [response]
             async with self._lock:
-                self._open_subscriptions -= 1
-            if "id" in response:
-                self._received[response["id"]] = response
-            elif "params" in response:
-                self._received[response["params"]["subscription"]] = response
-            else:
-                raise KeyError(response)
+                if (
+                    not isinstance(response, list)
+                    and response.get("id") is None
+                    and "error" in response
+                ):
+                    # A batch rejected as a whole (e.g. too large) is answered with one
+                    # error without an id. It can't be attributed to a specific batch, so
+                    # every unanswered batched request fails, rather than waiting forever.
+                    error = SubstrateRequestException(
+                        response["error"].get("message", str(response["error"]))
+                    )
+                    for item_id in self._pending_batch_ids:
+                        self._received[item_id] = error
+                    self._open_subscriptions -= len(self._pending_batch_ids)
+                    self._pending_batch_ids.clear()
+                    return
+                self._open_subscriptions -= len(responses)
+                self._pending_batch_ids.difference_update(
+                    response.get("id") for response in responses
+                )
+            for response in responses:
+                if "id" in response:
+                    self._received[response["id"]] = response
+                elif "params" in response:
+                    self._received[response["params"]["subscription"]] = response
+                else:
+                    raise KeyError(response)
         except ConnectionClosed:
             raise
         except KeyError as e:
@@ -738,6 +802,31 @@ class Websocket:
         except ConnectionClosed:
             raise
 
+    async def send_batch(self, payloads: list[dict]) -> list[int]:
+        """
+        Sends multiple payloads to the websocket connection as a single JSON-RPC batch request, so that they
+        travel in one frame instead of one frame per request.
+
+        :param payloads: payloads, generate each with the AsyncSubstrateInterface.make_payload method
+
+        :return: the ids of the sent payloads, in the same order as `payloads`
+        """
+        async with self._lock:
+            original_id = self.id
+            self.id += len(payloads)
+            self._open_subscriptions += len(payloads)
+            ids = list(range(original_id, original_id + len(payloads)))
+            self._pending_batch_ids.update(ids)
+        try:
+            await self.ws.send(
+                json.dumps(
+                    [{**payload, **{"id": id_}} for payload, id_ in zip(payloads, ids)]
+                )
+            )
+            return ids
+        except ConnectionClosed:
+            raise
+
     async def retrieve(self, item_id: int) -> Optional[dict]:
         """
         Retrieves a single item from received responses dict queue
@@ -745,11 +834,16 @@ class Websocket:
         :param item_id: id of the item to retrieve
 
         :return: retrieved item
+
+        :raises SubstrateRequestException: if the request was part of a batch which the node rejected
         """
         while True:
             async with self._lock:
                 if item_id in self._received:
-                    return self._received.pop(item_id)
+                    item = self._received.pop(item_id)
+                    if isinstance(item, SubstrateRequestException):
+                        raise item
+                    return item
             await asyncio.sleep(0.1)
 
 
@@ -793,6 +887,7 @@ class AsyncSubstrateInterface:
         self.ss58_format = ss58_format
         self.type_registry = type_registry
         self.runtime_cache = RuntimeCache()
+        self.query_cache = QueryCache()
         self.block_id: Optional[int] = None
         self.runtime_version = None
         self.runtime_config = RuntimeConfigurationObject()
@@ -1393,13 +1488,16 @@ class AsyncSubstrateInterface:
             include_author=include_author,
         )
 
-    async def get_events(self, block_hash: Optional[str] = None) -> list:
+    async def get_events(
+        self, block_hash: Optional[str] = None, extrinsic_idx: Optional[int] = None
+    ) -> list:
         """
         Convenience method to get events for a certain block (storage call for module 'System' and function 'Events')
 
         Parameters
         ----------
         block_hash
+        extrinsic_idx: if set, only the events applied by the extrinsic at this index are converted and returned
 
         Returns
         -------
@@ -1453,6 +1551,10 @@ class AsyncSubstrateInterface:
         if storage_obj:
             for item in list(storage_obj):
                 # print("item!", item)
+                if extrinsic_idx is not None:
+                    phase_value = next(iter(item["phase"].values()))
+                    if not phase_value or phase_value[0] != extrinsic_idx:
+                        continue
                 events.append(convert_event_data(item))
             # events += list(storage_obj)
         return events
@@ -1619,9 +1721,14 @@ class AsyncSubstrateInterface:
         subscription_added = False
 
         async with self.ws as ws:
-            for item in payloads:
-                item_id = await ws.send(item["payload"])
-                request_manager.add_request(item_id, item["id"])
+            if len(payloads) > 1 and not asyncio.iscoroutinefunction(result_handler):
+                item_ids = await ws.send_batch([item["payload"] for item in payloads])
+                for item_id, item in zip(item_ids, payloads):
+                    request_manager.add_request(item_id, item["id"])
+            else:
+                for item in payloads:
+                    item_id = await ws.send(item["payload"])
+                    request_manager.add_request(item_id, item["id"])
 
             while True:
                 for item_id in request_manager.response_map.keys():
@@ -1866,20 +1973,23 @@ class AsyncSubstrateInterface:
         result = []
 
         storage_key_map = {s.to_hex(): s for s in storage_keys}
+        # Decode all results in a single pass against the same registry, rather than awaiting `decode_scale`
+        # for every item. Missing values decode to None, as in `decode_scale`.
+        registry = self.registry
 
         for result_group in response["result"]:
             for change_storage_key, change_data in result_group["changes"]:
                 # Decode result for specified storage_key
                 storage_key = storage_key_map[change_storage_key]
-                if change_data is None:
-                    change_data = b"\x00"
-                else:
-                    change_data = bytes.fromhex(change_data[2:])
                 result.append(
                     (
                         storage_key,
-                        await self.decode_scale(
-                            storage_key.value_scale_type, change_data
+                        None
+                        if change_data is None or change_data == "0x00"
+                        else decode_by_type_string(
+                            storage_key.value_scale_type,
+                            registry,
+                            bytes.fromhex(change_data[2:]),
                         ),
                     )
                 )
@@ -2382,6 +2492,13 @@ class AsyncSubstrateInterface:
         block_hash = await self._get_current_block_hash(block_hash, reuse_block_hash)
         if block_hash:
             self.last_block_hash = block_hash
+        cache_key = (
+            None
+            if subscription_handler or raw_storage_key
+            else QueryCache.make_key(module, storage_function, params, block_hash)
+        )
+        if cache_key and (cached := self.query_cache.retrieve(cache_key)) is not None:
+            return cached
         runtime = await self.init_runtime(block_hash=block_hash)
         preprocessed: Preprocessed = await self._preprocess(
             params, block_hash, storage_function, module
@@ -2401,7 +2518,10 @@ class AsyncSubstrateInterface:
             runtime,
             result_handler=subscription_handler,
         )
-        return responses[preprocessed.queryable][0]
+        result = responses[preprocessed.queryable][0]
+        if cache_key:
+            self.query_cache.add_item(cache_key, result)
+        return result
 
     async def query_map(
         self,
@@ -727,7 +727,9 @@ async def run_faucet_extrinsic(
         return False, unlock_status.message
 
     # Get previous balance.
-    old_balance = await subtensor.get_balance(wallet.coldkeypub.ss58_address)
+    old_balance = await subtensor.get_balance_for_coldkey(
+        wallet.coldkeypub.ss58_address
+    )
 
     # Attempt rolling registration.
     attempts = 1
@@ -802,12 +804,12 @@ async def run_faucet_extrinsic(
 
             # Successful registration
             else:
-                new_balance = await subtensor.get_balance(
+                new_balance = await subtensor.get_balance_for_coldkey(
                     wallet.coldkeypub.ss58_address
                 )
                 console.print(
-                    f"Balance: [blue]{old_balance[wallet.coldkeypub.ss58_address]}[/blue] :arrow_right:"
-                    f" [green]{new_balance[wallet.coldkeypub.ss58_address]}[/green]"
+                    f"Balance: [blue]{old_balance}[/blue] :arrow_right:"
+                    f" [green]{new_balance}[/green]"
                 )
                 old_balance = new_balance
 
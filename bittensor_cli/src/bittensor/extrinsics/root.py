@@ -18,7 +18,7 @@
 import asyncio
 import hashlib
 import time
-from typing import Union, List, TYPE_CHECKING
+from typing import Optional, Union, List, TYPE_CHECKING
 
 from bittensor_wallet import Wallet, Keypair
 import numpy as np
@@ -46,11 +46,17 @@ U32_MAX = 4294967295
 U16_MAX = 65535
 
 
-async def get_limits(subtensor: SubtensorInterface) -> tuple[int, float]:
+async def get_limits(
+    subtensor: SubtensorInterface, block_hash: Optional[str] = None
+) -> tuple[int, float]:
     # Get weight restrictions.
     maw, mwl = await asyncio.gather(
-        subtensor.get_hyperparameter("MinAllowedWeights", netuid=0),
-        subtensor.get_hyperparameter("MaxWeightsLimit", netuid=0),
+        subtensor.get_hyperparameter(
+            "MinAllowedWeights", netuid=0, block_hash=block_hash
+        ),
+        subtensor.get_hyperparameter(
+            "MaxWeightsLimit", netuid=0, block_hash=block_hash
+        ),
     )
     min_allowed_weights = int(maw)
     max_weight_limit = u16_normalized_float(int(mwl))
@@ -70,7 +76,9 @@ def normalize_max_weight(
     """
     epsilon = 1e-7  # For numerical stability after normalization
 
-    weights = x.copy()
+    # A floating point copy, so that it can be normalized in place. Integer weights
+    # (e.g. u16 weights from the chain) become float64, as dividing them used to produce.
+    weights = x.astype(x.dtype if np.issubdtype(x.dtype, np.floating) else np.float64)
     values = np.sort(weights)
 
     if x.sum() == 0 or x.shape[0] * limit <= 1:
@@ -79,14 +87,15 @@ def normalize_max_weight(
         estimation = values / values.sum()
 
         if estimation.max() <= limit:
-            return weights / weights.sum()
+            # `weights` is already a floating point copy of x, so normalize it in place
+            return np.divide(weights, weights.sum(), out=weights)
 
         # Find the cumulative sum and sorted tensor
         cumsum = np.cumsum(estimation, 0)
 
         # Determine the index of cutoff
-        estimation_sum = np.array(
-            [(len(values) - i - 1) * estimation[i] for i in range(len(values))]
+        estimation_sum = (
+            np.arange(len(values) - 1, -1, -1, dtype=estimation.dtype) * estimation
         )
         n_values = (estimation / (estimation_sum + cumsum + epsilon) < limit).sum()
 
@@ -99,9 +108,7 @@ def normalize_max_weight(
         # Applying the cutoff
         weights[weights > cutoff] = cutoff
 
-        y = weights / weights.sum()
-
-        return y
+        return np.divide(weights, weights.sum(), out=weights)
 
 
 def convert_weights_and_uids_for_emit(
@@ -366,6 +373,8 @@ async def set_root_weights_extrinsic(
     wait_for_inclusion: bool = False,
     wait_for_finalization: bool = False,
     prompt: bool = False,
+    block_hash: Optional[str] = None,
+    limits: Optional[tuple[int, float]] = None,
 ) -> bool:
     """Sets the given weights and values on chain for wallet hotkey account.
 
@@ -379,6 +388,9 @@ async def set_root_weights_extrinsic(
     :param wait_for_finalization: If set, waits for the extrinsic to be finalized on the chain before returning `True`,
                                   or returns `False` if the extrinsic fails to be finalized within the timeout.
     :param prompt: If `True`, the call waits for confirmation from the user before proceeding.
+    :param block_hash: The block hash at which to read the uid and weight limits. Defaults to the chain head.
+    :param limits: The (min allowed weights, max weight limit) pair from `get_limits`, if already fetched by the
+                   caller. Fetched at `block_hash` otherwise.
     :return: `True` if extrinsic was finalized or included in the block. If we did not wait for finalization/inclusion,
              the response is `True`.
     """
@@ -416,9 +428,21 @@ async def set_root_weights_extrinsic(
         else:
             return False, await response.error_message
 
-    my_uid = await subtensor.substrate.query(
-        "SubtensorModule", "Uids", [0, wallet.hotkey.ss58_address]
+    print_verbose("Fetching uid and weight limits")
+    uid_query = subtensor.substrate.query(
+        "SubtensorModule",
+        "Uids",
+        [0, wallet.hotkey.ss58_address],
+        block_hash=block_hash,
     )
+    if limits is None:
+        # the weight limits do not depend on the uid, so fetch them alongside it
+        my_uid, limits = await asyncio.gather(
+            uid_query, get_limits(subtensor, block_hash)
+        )
+    else:
+        my_uid = await uid_query
+    min_allowed_weights, max_weight_limit = limits
 
     if my_uid is None:
         err_console.print("Your hotkey is not registered to the root network")
@@ -428,13 +452,15 @@ async def set_root_weights_extrinsic(
         return False
 
     # First convert types.
+    # (arrays that already have the right dtype are used as they are, without a copy)
     if isinstance(netuids, list):
-        netuids = np.array(netuids, dtype=np.int64)
+        netuids = np.fromiter(netuids, dtype=np.int64, count=len(netuids))
+    else:
+        netuids = np.asarray(netuids, dtype=np.int64)
     if isinstance(weights, list):
-        weights = np.array(weights, dtype=np.float32)
-
-    print_verbose("Fetching weight limits")
-    min_allowed_weights, max_weight_limit = await get_limits(subtensor)
+        weights = np.fromiter(weights, dtype=np.float32, count=len(weights))
+    else:
+        weights = np.asarray(weights, dtype=np.float32)
 
     # Get non zero values.
     non_zero_weight_idx = np.argwhere(weights > 0).squeeze(axis=1)
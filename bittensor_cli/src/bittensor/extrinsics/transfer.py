@@ -1,7 +1,9 @@
 import asyncio
+from typing import Optional
 
 from bittensor_wallet import Wallet
 from rich.prompt import Confirm
+from scalecodec import GenericCall, GenericExtrinsic
 from substrateinterface.exceptions import SubstrateRequestException
 
 from bittensor_cli.src import NETWORK_EXPLORER_MAP
@@ -18,6 +20,10 @@ from bittensor_cli.src.bittensor.utils import (
     unlock_key,
 )
 
+# Conservative upper bound for a single transfer fee, used to skip the fee estimation when the balance is clearly
+# sufficient. The fee is informational only, and is never sent to the chain.
+FEE_UPPER_BOUND = Balance.from_rao(int(5e7))
+
 
 async def transfer_extrinsic(
     subtensor: SubtensorInterface,
@@ -47,18 +53,26 @@ async def transfer_extrinsic(
                       finalization / inclusion, the response is `True`, regardless of its inclusion.
     """
 
-    async def get_transfer_fee() -> Balance:
+    async def compose_transfer_call(block_hash_: Optional[str] = None) -> GenericCall:
         """
-        Calculates the transaction fee for transferring tokens from a wallet to a specified destination address.
-        This function simulates the transfer to estimate the associated cost, taking into account the current
-        network conditions and transaction complexity.
+        Composes the `transfer_allow_death` call for the current amount. The call is composed once and shared
+        between the fee estimation and the transfer itself.
+
+        :param block_hash_: the block hash whose metadata is used to compose the call
         """
-        call = await subtensor.substrate.compose_call(
+        return await subtensor.substrate.compose_call(
             call_module="Balances",
             call_function="transfer_allow_death",
             call_params={"dest": destination, "value": amount.rao},
+            block_hash=block_hash_,
         )
 
+    async def get_transfer_fee(call: GenericCall) -> Balance:
+        """
+        Calculates the transaction fee for transferring tokens from a wallet to a specified destination address.
+        This function simulates the transfer to estimate the associated cost, taking into account the current
+        network conditions and transaction complexity.
+        """
         try:
             payment_info = await subtensor.substrate.get_payment_info(
                 call=call, keypair=wallet.coldkeypub
@@ -73,19 +87,12 @@ async def transfer_extrinsic(
 
         return Balance.from_rao(payment_info["partialFee"])
 
-    async def do_transfer() -> tuple[bool, str, str]:
+    async def do_transfer(extrinsic: GenericExtrinsic) -> tuple[bool, str, str]:
         """
         Makes transfer from wallet to destination public key address.
+        :param extrinsic: the signed transfer extrinsic
         :return: success, block hash, formatted error message
         """
-        call = await subtensor.substrate.compose_call(
-            call_module="Balances",
-            call_function="transfer_allow_death",
-            call_params={"dest": destination, "value": amount.rao},
-        )
-        extrinsic = await subtensor.substrate.create_signed_extrinsic(
-            call=call, keypair=wallet.coldkey
-        )
         response = await subtensor.substrate.submit_extrinsic(
             extrinsic,
             wait_for_inclusion=wait_for_inclusion,
@@ -95,8 +102,7 @@ async def transfer_extrinsic(
         if not wait_for_finalization and not wait_for_inclusion:
             return True, "", ""
 
-        # Otherwise continue with finalization.
-        await response.process_events()
+        # Otherwise continue with finalization. `is_success` only processes the events of this extrinsic.
         if await response.is_success:
             block_hash_ = response.block_hash
             return True, block_hash_, ""
@@ -107,6 +113,13 @@ async def transfer_extrinsic(
                 format_error_message(await response.error_message),
             )
 
+    def discard_sign_task(task: asyncio.Task) -> None:
+        """Cancels a signing task whose extrinsic won't be submitted, retrieving its exception if it failed."""
+        if not task.done():
+            task.cancel()
+        elif not task.cancelled():
+            task.exception()
+
     # Validate destination address.
     if not is_valid_bittensor_address_or_public_key(destination):
         err_console.print(
@@ -118,57 +131,102 @@ async def transfer_extrinsic(
     if not unlock_key(wallet).success:
         return False
 
-    # Check balance.
-    with console.status(
-        f":satellite: Checking balance and fees on chain [white]{subtensor.network}[/white]",
-        spinner="aesthetic",
-    ) as status:
-        # check existential deposit and fee
-        print_verbose("Fetching existential and fee", status)
-        block_hash = await subtensor.substrate.get_chain_head()
-        account_balance_, existential_deposit = await asyncio.gather(
-            subtensor.get_balance(
-                wallet.coldkeypub.ss58_address, block_hash=block_hash
-            ),
-            subtensor.get_existential_deposit(block_hash=block_hash),
-        )
-        account_balance = account_balance_[wallet.coldkeypub.ss58_address]
-        fee = await get_transfer_fee()
-
-    if not keep_alive:
-        # Check if the transfer should keep_alive the account
-        existential_deposit = Balance(0)
-
-    # Check if we have enough balance.
-    if transfer_all is True:
-        amount = account_balance - fee - existential_deposit
-        if amount < Balance(0):
-            print_error("Not enough balance to transfer")
-            return False
+    # Any path that doesn't submit the signed extrinsic, including an RPC call raising, discards the
+    # signing task, so that it isn't left pending.
+    sign_task: Optional[asyncio.Task] = None
+    try:
+        # Check balance.
+        with console.status(
+            f":satellite: Checking balance and fees on chain [white]{subtensor.network}[/white]",
+            spinner="aesthetic",
+        ) as status:
+            # check existential deposit and fee. The existential deposit is a runtime
+            # constant, so its cached chain head value is used.
+            print_verbose("Fetching existential and fee", status)
+            block_hash = await subtensor.substrate.get_chain_head()
+            call = await compose_transfer_call(block_hash)
+            # Sign while the balance and fee checks are in flight.
+            sign_task = asyncio.create_task(
+                subtensor.substrate.create_signed_extrinsic(
+                    call=call, keypair=wallet.coldkey
+                )
+            )
+            if prompt or transfer_all:
+                # the exact fee is needed for display or for computing the amount
+                account_balance, existential_deposit, fee = await asyncio.gather(
+                    subtensor.get_balance_for_coldkey(
+                        wallet.coldkeypub.ss58_address, block_hash=block_hash
+                    ),
+                    subtensor.get_existential_deposit(),
+                    get_transfer_fee(call),
+                )
+            else:
+                account_balance, existential_deposit = await asyncio.gather(
+                    subtensor.get_balance_for_coldkey(
+                        wallet.coldkeypub.ss58_address, block_hash=block_hash
+                    ),
+                    subtensor.get_existential_deposit(),
+                )
+                if account_balance >= amount + FEE_UPPER_BOUND + existential_deposit:
+                    fee = FEE_UPPER_BOUND
+                else:
+                    fee = await get_transfer_fee(call)
 
-    if account_balance < (amount + fee + existential_deposit):
-        err_console.print(
-            ":cross_mark: [bold red]Not enough balance[/bold red]:\n\n"
-            f"  balance: [bright_cyan]{account_balance}[/bright_cyan]\n"
-            f"  amount: [bright_cyan]{amount}[/bright_cyan]\n"
-            f"  for fee: [bright_cyan]{fee}[/bright_cyan]"
-        )
-        return False
+        if not keep_alive:
+            # Check if the transfer should keep_alive the account
+            existential_deposit = Balance(0)
 
-    # Ask before moving on.
-    if prompt:
-        if not Confirm.ask(
-            "Do you want to transfer:[bold white]\n"
-            f"  amount: [bright_cyan]{amount}[/bright_cyan]\n"
-            f"  from: [light_goldenrod2]{wallet.name}[/light_goldenrod2] : [bright_magenta]{wallet.coldkey.ss58_address}\n[/bright_magenta]"
-            f"  to: [bright_magenta]{destination}[/bright_magenta]\n  for fee: [bright_cyan]{fee}[/bright_cyan]"
-        ):
+        # Check if we have enough balance.
+        if transfer_all is True:
+            amount = account_balance - fee - existential_deposit
+            discard_sign_task(sign_task)
+            if amount < Balance(0):
+                print_error("Not enough balance to transfer")
+                return False
+            # The amount changed, so the shared call must be recomposed and re-signed.
+            call = await compose_transfer_call(block_hash)
+            sign_task = asyncio.create_task(
+                subtensor.substrate.create_signed_extrinsic(
+                    call=call, keypair=wallet.coldkey
+                )
+            )
+
+        if account_balance < (amount + fee + existential_deposit):
+            err_console.print(
+                ":cross_mark: [bold red]Not enough balance[/bold red]:\n\n"
+                f"  balance: [bright_cyan]{account_balance}[/bright_cyan]\n"
+                f"  amount: [bright_cyan]{amount}[/bright_cyan]\n"
+                f"  for fee: [bright_cyan]{fee}[/bright_cyan]"
+            )
             return False
 
+        # Ask before moving on.
+        if prompt:
+            if not Confirm.ask(
+                "Do you want to transfer:[bold white]\n"
+                f"  amount: [bright_cyan]{amount}[/bright_cyan]\n"
+                f"  from: [light_goldenrod2]{wallet.name}[/light_goldenrod2] : [bright_magenta]{wallet.coldkey.ss58_address}\n[/bright_magenta]"
+                f"  to: [bright_magenta]{destination}[/bright_magenta]\n  for fee: [bright_cyan]{fee}[/bright_cyan]"
+            ):
+                return False
+
+        extrinsic = await sign_task
+        sign_task = None  # consumed
+    finally:
+        if sign_task is not None:
+            discard_sign_task(sign_task)
+
     with console.status(":satellite: Transferring...", spinner="earth") as status:
-        success, block_hash, err_msg = await do_transfer()
+        success, block_hash, err_msg = await do_transfer(extrinsic)
 
         if success:
+            # Start fetching the new balance while the result is being reported. The balance is read at the
+            # inclusion/finalization block, so that it reflects the transfer.
+            new_balance_task = asyncio.create_task(
+                subtensor.get_balance_for_coldkey(
+                    wallet.coldkeypub.ss58_address, block_hash=block_hash or None
+                )
+            )
             console.print(":white_heavy_check_mark: [green]Finalized[/green]")
             console.print(f"[green]Block Hash: {block_hash}[/green]")
 
@@ -189,12 +247,10 @@ async def transfer_extrinsic(
 
     if success:
         with console.status(":satellite: Checking Balance...", spinner="aesthetic"):
-            new_balance = await subtensor.get_balance(
-                wallet.coldkeypub.ss58_address, reuse_block=False
-            )
+            new_balance = await new_balance_task
             console.print(
                 f"Balance:\n"
-                f"  [blue]{account_balance}[/blue] :arrow_right: [green]{new_balance[wallet.coldkeypub.ss58_address]}[/green]"
+                f"  [blue]{account_balance}[/blue] :arrow_right: [green]{new_balance}[/green]"
             )
             return True
 
@@ -1,4 +1,9 @@
 import asyncio
+import contextlib
+import json
+import os
+import tempfile
+import time
 from typing import Optional, Any, Union, TypedDict, Iterable
 
 
@@ -7,13 +12,13 @@ from bittensor_wallet import Wallet
 from bittensor_wallet.utils import SS58_FORMAT
 import scalecodec
 from scalecodec import GenericCall
-from scalecodec.base import RuntimeConfiguration
-from scalecodec.type_registry import load_type_registry_preset
 from substrateinterface.exceptions import SubstrateRequestException
 import typer
 
 from bittensor_cli.src.bittensor.async_substrate_interface import (
     AsyncSubstrateInterface,
+    ExtrinsicReceipt,
+    QueryMapResult,
     TimeoutException,
 )
 from bittensor_cli.src.bittensor.chain_data import (
@@ -36,8 +41,68 @@ from bittensor_cli.src.bittensor.utils import (
     decode_hex_identity_dict,
     validate_chain_endpoint,
     hex_to_bytes,
+    get_rpc_runtime_config,
 )
 
+# (fetch time, payload) of the delegates details from GitHub, shared by all commands of the process
+_github_delegates_cache: dict[str, tuple[float, dict[str, Any]]] = {}
+
+
+async def _get_github_delegates_details() -> Optional[dict[str, Any]]:
+    """
+    Fetches the delegates details published on GitHub. The payload is kept in memory and on disk (at
+    `defaults.delegates.cache_path`) for `defaults.delegates.cache_ttl` seconds, so that the commands run within
+    that window, in this or a new process, reuse it rather than fetching it again.
+
+    :return: {hotkey_ss58: details, ...}, or `None` if GitHub could not serve it
+    """
+    url = Constants.delegates_detail_url
+    now = time.time()
+    if (cached := _github_delegates_cache.get(url)) and (
+        now - cached[0] < defaults.delegates.cache_ttl
+    ):
+        return cached[1]
+
+    cache_path = os.path.expanduser(defaults.delegates.cache_path)
+    try:
+        modified = os.path.getmtime(cache_path)
+        if now - modified < defaults.delegates.cache_ttl:
+            with open(cache_path) as f:
+                details = json.load(f)
+            if isinstance(details, dict):
+                _github_delegates_cache[url] = (modified, details)
+                return details
+    except (OSError, ValueError):
+        pass  # missing or unreadable cache file, fetch it anew
+
+    timeout = aiohttp.ClientTimeout(10.0)
+    async with aiohttp.ClientSession(timeout=timeout) as session:
+        async with session.get(url) as response:
+            if not response.ok:
+                return None
+            details: dict[str, Any] = await response.json(content_type=None)
+    if not isinstance(details, dict):
+        return None
+
+    _github_delegates_cache[url] = (now, details)
+    try:
+        cache_dir = os.path.dirname(cache_path)
+        os.makedirs(cache_dir, exist_ok=True)
+        # written to a temporary file which then replaces the cache, so that concurrent or interrupted
+        # writes never leave a truncated cache file behind
+        fd, temp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(details, f)
+            os.replace(temp_path, cache_path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.remove(temp_path)
+            raise
+    except OSError:
+        pass  # caching on disk is best-effort
+    return details
+
 
 class ParamWithTypes(TypedDict):
     name: str  # Name of the parameter.
@@ -107,6 +172,8 @@ class SubtensorInterface:
             type_registry=TYPE_REGISTRY,
             chain_name="JungoAI",
         )
+        # existential deposit at the chain head, fetched once per process
+        self._existential_deposit: Optional[Balance] = None
 
     def __str__(self):
         return f"Network: {self.network}, Chain: {self.chain_endpoint}"
@@ -168,7 +235,7 @@ class SubtensorInterface:
         )
         return (
             []
-            if result is None or not hasattr(result, "records")
+            if not isinstance(result, QueryMapResult)
             else [netuid async for netuid, exists in result if exists]
         )
 
@@ -317,10 +384,7 @@ class SubtensorInterface:
 
         as_scale_bytes = scalecodec.ScaleBytes(json_result["result"])  # type: ignore
 
-        rpc_runtime_config = RuntimeConfiguration()
-        rpc_runtime_config.update_type_registry(load_type_registry_preset("legacy"))
-        rpc_runtime_config.update_type_registry(custom_rpc_type_registry)
-
+        rpc_runtime_config = get_rpc_runtime_config(custom_rpc_type_registry)
         obj = rpc_runtime_config.create_scale_object(return_type, as_scale_bytes)
         if obj.data.to_hex() == "0x0400":  # RPC returned None result
             return None
@@ -355,6 +419,31 @@ class SubtensorInterface:
             results.update({item[0].params[0]: Balance(value["data"]["free"])})
         return results
 
+    async def get_balance_for_coldkey(
+        self,
+        address: str,
+        block_hash: Optional[str] = None,
+        reuse_block: bool = False,
+    ) -> Balance:
+        """
+        Retrieves the balance for a single coldkey. Prefer this to `get_balance` when only one address is needed,
+        as it avoids building the storage keys and result dict of a multi-address query.
+
+        :param address: coldkey address
+        :param block_hash: the block hash, optional
+        :param reuse_block: Whether to reuse the last-used block hash when retrieving info.
+        :return: Balance object
+        """
+        result = await self.substrate.query(
+            module="System",
+            storage_function="Account",
+            params=[address],
+            block_hash=block_hash,
+            reuse_block_hash=reuse_block,
+        )
+        value = result or {"data": {"free": 0}}
+        return Balance(value["data"]["free"])
+
     async def get_total_stake_for_coldkey(
         self,
         *ss58_addresses,
@@ -402,14 +491,24 @@ class SubtensorInterface:
 
         :return: {address: Balance objects}
         """
-        results = await self.substrate.query_multiple(
-            params=[s for s in ss58_addresses],
-            module="SubtensorModule",
-            storage_function="TotalHotkeyStake",
-            block_hash=block_hash,
-            reuse_block_hash=reuse_block,
-        )
-        return {k: Balance.from_rao(r or 0) for (k, r) in results.items()}
+        if not block_hash and reuse_block:
+            block_hash = self.substrate.last_block_hash
+        calls = [
+            (
+                await self.substrate.create_storage_key(
+                    "SubtensorModule",
+                    "TotalHotkeyStake",
+                    [address],
+                    block_hash=block_hash,
+                )
+            )
+            for address in ss58_addresses
+        ]
+        batch_call = await self.substrate.query_multi(calls, block_hash=block_hash)
+        results = {address: Balance(0) for address in ss58_addresses}
+        for item in batch_call:
+            results.update({item[0].params[0]: Balance.from_rao(item[1] or 0)})
+        return results
 
     async def get_netuids_for_hotkey(
         self,
@@ -438,7 +537,7 @@ class SubtensorInterface:
         )
         return (
             [record[0] async for record in result if record[1]]
-            if result and hasattr(result, "records")
+            if isinstance(result, QueryMapResult)
             else []
         )
 
@@ -567,8 +666,14 @@ class SubtensorInterface:
         :return: The existential deposit amount
 
         The existential deposit is a fundamental economic parameter in the Bittensor network, ensuring
-        efficient use of storage and preventing the proliferation of dust accounts.
+        efficient use of storage and preventing the proliferation of dust accounts. As it is a runtime constant,
+        the deposit at the chain head (no `block_hash`, and `reuse_block` unset) is only retrieved from the chain
+        once, and cached for subsequent calls. Queries at a specific block always go to the chain.
         """
+        at_head = block_hash is None and not reuse_block
+        if at_head and self._existential_deposit is not None:
+            return self._existential_deposit
+
         result = await self.substrate.get_constant(
             module_name="Balances",
             constant_name="ExistentialDeposit",
@@ -579,7 +684,10 @@ class SubtensorInterface:
         if result is None:
             raise Exception("Unable to retrieve existential deposit amount.")
 
-        return Balance.from_rao(result)
+        existential_deposit = Balance.from_rao(result)
+        if at_head:
+            self._existential_deposit = existential_deposit
+        return existential_deposit
 
     async def neurons(
         self, netuid: int, block_hash: Optional[str] = None
@@ -897,6 +1005,29 @@ class SubtensorInterface:
 
         :return: (success, error message)
         """
+        success, err_msg, _ = await self.sign_and_send_extrinsic_with_receipt(
+            call, wallet, wait_for_inclusion, wait_for_finalization
+        )
+        return success, err_msg
+
+    async def sign_and_send_extrinsic_with_receipt(
+        self,
+        call: GenericCall,
+        wallet: Wallet,
+        wait_for_inclusion: bool = True,
+        wait_for_finalization: bool = False,
+    ) -> tuple[bool, str, Optional[ExtrinsicReceipt]]:
+        """
+        Signs and submits an extrinsic call to chain, like `sign_and_send_extrinsic`, but also returns the
+        receipt, so that callers can use its block hash or events without querying the chain again.
+
+        :param call: a prepared Call object
+        :param wallet: the wallet whose coldkey will be used to sign the extrinsic
+        :param wait_for_inclusion: whether to wait until the extrinsic call is included on the chain
+        :param wait_for_finalization: whether to wait until the extrinsic call is finalized on the chain
+
+        :return: (success, error message, receipt), the receipt is `None` if the submission failed
+        """
         extrinsic = await self.substrate.create_signed_extrinsic(
             call=call, keypair=wallet.coldkey
         )  # sign with coldkey
@@ -908,14 +1039,18 @@ class SubtensorInterface:
             )
             # We only wait here if we expect finalization.
             if not wait_for_finalization and not wait_for_inclusion:
-                return True, ""
+                return True, "", response
             await response.process_events()
             if await response.is_success:
-                return True, ""
+                return True, "", response
             else:
-                return False, format_error_message(await response.error_message)
+                return (
+                    False,
+                    format_error_message(await response.error_message),
+                    response,
+                )
         except SubstrateRequestException as e:
-            return False, format_error_message(e)
+            return False, format_error_message(e), None
 
     async def get_children(self, hotkey, netuid) -> tuple[bool, list, str]:
         """
@@ -1019,50 +1154,41 @@ class SubtensorInterface:
         Returns: {ss58: DelegatesDetails, ...}
 
         """
-        timeout = aiohttp.ClientTimeout(10.0)
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            identities_info, response = await asyncio.gather(
-                self.substrate.query_map(
-                    module="Registry",
-                    storage_function="IdentityOf",
-                    block_hash=block_hash,
+        identities_info, all_delegates = await asyncio.gather(
+            self.substrate.query_map(
+                module="Registry",
+                storage_function="IdentityOf",
+                block_hash=block_hash,
+            ),
+            _get_github_delegates_details(),
+        )
+
+        all_delegates_details = {
+            decode_account_id(ss58_address[0]): DelegatesDetails.from_chain_data(
+                decode_hex_identity_dict(identity["info"])
+            )
+            for ss58_address, identity in identities_info
+        }
+
+        for delegate_hotkey, delegate_details in (all_delegates or {}).items():
+            delegate_info = all_delegates_details.setdefault(
+                delegate_hotkey,
+                DelegatesDetails(
+                    display=delegate_details.get("name", ""),
+                    web=delegate_details.get("url", ""),
+                    additional=delegate_details.get("description", ""),
+                    pgp_fingerprint=delegate_details.get("fingerprint", ""),
                 ),
-                session.get(Constants.delegates_detail_url),
             )
-
-            all_delegates_details = {
-                decode_account_id(ss58_address[0]): DelegatesDetails.from_chain_data(
-                    decode_hex_identity_dict(identity["info"])
-                )
-                for ss58_address, identity in identities_info
-            }
-
-            if response.ok:
-                all_delegates: dict[str, Any] = await response.json(content_type=None)
-
-                for delegate_hotkey, delegate_details in all_delegates.items():
-                    delegate_info = all_delegates_details.setdefault(
-                        delegate_hotkey,
-                        DelegatesDetails(
-                            display=delegate_details.get("name", ""),
-                            web=delegate_details.get("url", ""),
-                            additional=delegate_details.get("description", ""),
-                            pgp_fingerprint=delegate_details.get("fingerprint", ""),
-                        ),
-                    )
-                    delegate_info.display = (
-                        delegate_info.display or delegate_details.get("name", "")
-                    )
-                    delegate_info.web = delegate_info.web or delegate_details.get(
-                        "url", ""
-                    )
-                    delegate_info.additional = (
-                        delegate_info.additional
-                        or delegate_details.get("description", "")
-                    )
-                    delegate_info.pgp_fingerprint = (
-                        delegate_info.pgp_fingerprint
-                        or delegate_details.get("fingerprint", "")
-                    )
+            delegate_info.display = delegate_info.display or delegate_details.get(
+                "name", ""
+            )
+            delegate_info.web = delegate_info.web or delegate_details.get("url", "")
+            delegate_info.additional = delegate_info.additional or delegate_details.get(
+                "description", ""
+            )
+            delegate_info.pgp_fingerprint = (
+                delegate_info.pgp_fingerprint or delegate_details.get("fingerprint", "")
+            )
 
         return all_delegates_details
@@ -1,5 +1,7 @@
 import ast
 from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import math
 import os
 import sqlite3
@@ -8,7 +10,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Any, Collection, Optional, Union, Callable
 from urllib.parse import urlparse
 
-from bittensor_wallet import Wallet, Keypair
+from bittensor_wallet import Wallet
 from bittensor_wallet.utils import SS58_FORMAT
 from bittensor_wallet.errors import KeyFileError, PasswordError
 from bittensor_wallet import utils
@@ -18,7 +20,7 @@ import numpy as np
 from numpy.typing import NDArray
 from rich.console import Console
 import scalecodec
-from scalecodec.base import RuntimeConfiguration
+from scalecodec.base import RuntimeConfigurationObject
 from scalecodec.type_registry import load_type_registry_preset
 import typer
 
@@ -72,7 +74,13 @@ U64_MAX = 18446744073709551615
 
 def u16_normalized_float(x: int) -> float:
     """Converts a u16 int to a float"""
-    return float(x) / float(U16_MAX)
+    # int / int true division is already a correctly rounded float, so no casts are needed
+    return x / U16_MAX
+
+
+def u16_normalized_floats(xs: Collection[int]) -> NDArray[np.float64]:
+    """Converts a collection of u16 ints to floats, in a single vectorised operation"""
+    return np.asarray(xs, dtype=np.float64) / float(U16_MAX)
 
 
 def u64_normalized_float(x: int) -> float:
@@ -209,14 +217,18 @@ def get_hotkey_wallets_for_wallet(
              `show_nulls` is set to `True`)
     """
     hotkey_wallets = []
-    wallet_path = Path(wallet.path).expanduser()
-    hotkeys_path = wallet_path / wallet.name / "hotkeys"
+    # expanded once, and reused for every hotkey wallet built below
+    wallet_path = os.path.expanduser(wallet.path)
+    wallet_name = wallet.name
+    hotkeys_path = os.path.join(wallet_path, wallet_name, "hotkeys")
     try:
-        hotkeys = [entry.name for entry in hotkeys_path.iterdir()]
+        with os.scandir(hotkeys_path) as entries:
+            # directories can't be keyfiles, so don't build wallets for them
+            hotkeys = [entry.name for entry in entries if entry.is_file()]
     except FileNotFoundError:
         hotkeys = []
     for h_name in hotkeys:
-        hotkey_for_name = Wallet(path=str(wallet_path), name=wallet.name, hotkey=h_name)
+        hotkey_for_name = Wallet(path=wallet_path, name=wallet_name, hotkey=h_name)
         try:
             if (
                 hotkey_for_name.hotkey_file.exists_on_device()
@@ -242,11 +254,13 @@ def get_coldkey_wallets_for_path(path: str) -> list[Wallet]:
     """Gets all wallets with coldkeys from a given path"""
     wallet_path = Path(path).expanduser()
     try:
-        wallets = [
-            Wallet(name=directory.name, path=path)
-            for directory in wallet_path.iterdir()
-            if directory.is_dir()
-        ]
+        # scandir entries carry their file type, so `is_dir` needs no extra stat call
+        with os.scandir(wallet_path) as entries:
+            wallets = [
+                Wallet(name=entry.name, path=path)
+                for entry in entries
+                if entry.is_dir()
+            ]
     except FileNotFoundError:
         wallets = []
     return wallets
@@ -255,16 +269,34 @@ def get_coldkey_wallets_for_path(path: str) -> list[Wallet]:
 def get_all_wallets_for_path(path: str) -> list[Wallet]:
     """Gets all wallets from a given path."""
     all_wallets = []
-    cold_wallets = get_coldkey_wallets_for_path(path)
-    for cold_wallet in cold_wallets:
+    try:
+        with os.scandir(os.path.expanduser(path)) as entries:
+            # only build wallets for directories which have a coldkeypub file
+            cold_wallets = [
+                Wallet(name=entry.name, path=path)
+                for entry in entries
+                if entry.is_dir()
+                and os.path.isfile(os.path.join(entry.path, "coldkeypub.txt"))
+            ]
+    except FileNotFoundError:
+        cold_wallets = []
+
+    def hotkey_wallets_for(cold_wallet: Wallet) -> list[Wallet]:
         try:
-            if (
-                cold_wallet.coldkeypub_file.exists_on_device()
-                and not cold_wallet.coldkeypub_file.is_encrypted()
-            ):
-                all_wallets.extend(get_hotkey_wallets_for_wallet(cold_wallet))
+            if not cold_wallet.coldkeypub_file.is_encrypted():
+                return get_hotkey_wallets_for_wallet(cold_wallet)
         except UnicodeDecodeError:  # usually an incorrect file like .DS_Store
-            continue
+            pass
+        return []
+
+    if len(cold_wallets) <= 1:
+        hotkey_wallets = map(hotkey_wallets_for, cold_wallets)
+    else:
+        # reading keyfiles is IO-bound, so coldkeys are read in parallel (in order)
+        with ThreadPoolExecutor(max_workers=min(8, len(cold_wallets))) as executor:
+            hotkey_wallets = list(executor.map(hotkey_wallets_for, cold_wallets))
+    for wallets in hotkey_wallets:
+        all_wallets.extend(wallets)
     return all_wallets
 
 
@@ -298,25 +330,30 @@ def is_valid_wallet(wallet: Wallet) -> tuple[bool, bool]:
 
     :return: tuple[bool], whether wallet appears valid, whether valid hotkey in wallet
     """
-    return (
-        all(
-            [
-                os.path.exists(wp := os.path.expanduser(wallet.path)),
-                os.path.exists(os.path.join(wp, wallet.name)),
-            ]
-        ),
-        os.path.isfile(os.path.join(wp, wallet.name, "hotkeys", wallet.hotkey_str)),
+    wallet_dir = os.path.join(os.path.expanduser(wallet.path), wallet.name)
+    valid_hotkey = os.path.isfile(
+        os.path.join(wallet_dir, "hotkeys", wallet.hotkey_str)
     )
+    # the hotkey file existing implies its wallet (and wallet path) directories do, and the
+    # wallet directory existing implies the wallet path does, so one stat usually suffices
+    return valid_hotkey or os.path.exists(wallet_dir), valid_hotkey
 
 
 def is_valid_ss58_address(address: str) -> bool:
     """
-    Checks if the given address is a valid ss58 address.
+    Checks if the given address is a valid ss58 address. Results are cached, as the same addresses are
+    often checked repeatedly within a command.
 
     :param address: The address to check.
 
     :return: `True` if the address is a valid ss58 address for Bittensor, `False` otherwise.
     """
+    # only strings reach the cache, so unhashable input is rejected rather than raising
+    return isinstance(address, str) and _is_valid_ss58_address(address)
+
+
+@lru_cache(maxsize=4096)
+def _is_valid_ss58_address(address: str) -> bool:
     try:
         return utils.is_valid_ss58_address(
             address
@@ -336,20 +373,18 @@ def is_valid_ed25519_pubkey(public_key: Union[str, bytes]) -> bool:
     """
     try:
         if isinstance(public_key, str):
-            if len(public_key) != 64 and len(public_key) != 66:
+            # an optional "0x" prefix, followed by the hex of the 32 bytes of the key
+            hex_key = public_key[2:] if public_key.startswith("0x") else public_key
+            if len(hex_key) != 64:
                 raise ValueError("a public_key should be 64 or 66 characters")
-        elif isinstance(public_key, bytes):
-            if len(public_key) != 32:
-                raise ValueError("a public_key should be 32 bytes")
-        else:
+            public_key = bytes.fromhex(hex_key)
+        elif not isinstance(public_key, bytes):
             raise ValueError("public_key must be a string or bytes")
 
-        keypair = Keypair(public_key=public_key, ss58_format=SS58_FORMAT)
-
-        ss58_addr = keypair.ss58_address
-        return ss58_addr is not None
+        # Any 32 bytes can be ss58-encoded, so the length is all that needs checking
+        return len(public_key) == 32
 
-    except (ValueError, IndexError):
+    except ValueError:
         return False
 
 
@@ -376,19 +411,77 @@ def is_valid_bittensor_address_or_public_key(address: Union[str, bytes]) -> bool
         return False
 
 
+class CachedRuntimeConfiguration(RuntimeConfigurationObject):
+    """
+    A RuntimeConfigurationObject which memoizes `get_decoder_class` by type string, as resolving the
+    decoder class (registry lookups, regex matching, and dynamic class creation) is the bulk of the
+    cost of decoding. The memo is cleared whenever the type registry is updated.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self._decoder_classes: dict[str, Any] = {}
+        super().__init__(*args, **kwargs)
+
+    def update_type_registry(self, type_registry):
+        self._decoder_classes.clear()
+        super().update_type_registry(type_registry)
+
+    def get_decoder_class(self, type_string: Union[str, dict]):
+        if type(type_string) is dict:
+            return super().get_decoder_class(type_string)
+        try:
+            decoder_class = self._decoder_classes[type_string]
+        except KeyError:
+            decoder_class = self._decoder_classes[type_string] = (
+                super().get_decoder_class(type_string)
+            )
+        else:
+            if decoder_class:
+                # decoder classes are shared between configurations, so the lookup must
+                # still attach this configuration to the class, as scalecodec does
+                decoder_class.runtime_config = self
+        return decoder_class
+
+
+# {id(custom_rpc_type_registry): (custom_rpc_type_registry, runtime config)}
+_RUNTIME_CACHE: dict[int, tuple[dict, CachedRuntimeConfiguration]] = {}
+
+
+def get_rpc_runtime_config(
+    custom_rpc_type_registry: dict,
+) -> CachedRuntimeConfiguration:
+    """
+    Returns a runtime configuration with the legacy preset and the given type registry loaded. Loading the
+    registries is far more expensive than decoding a small RPC result, so one configuration is built per
+    registry and reused.
+
+    :param custom_rpc_type_registry: the custom type registry to load on top of the legacy preset
+
+    :return: the configured runtime
+    """
+    key = id(custom_rpc_type_registry)
+    cached = _RUNTIME_CACHE.get(key)
+    # the registry is kept alongside its config, so a recycled id can't match a different registry
+    if cached is None or cached[0] is not custom_rpc_type_registry:
+        rpc_runtime_config = CachedRuntimeConfiguration()
+        rpc_runtime_config.update_type_registry(load_type_registry_preset("legacy"))
+        rpc_runtime_config.update_type_registry(custom_rpc_type_registry)
+        cached = _RUNTIME_CACHE[key] = (custom_rpc_type_registry, rpc_runtime_config)
+    return cached[1]
+
+
 def decode_scale_bytes(return_type, scale_bytes, custom_rpc_type_registry):
     """Decodes a ScaleBytes object using our type registry and return type"""
-    rpc_runtime_config = RuntimeConfiguration()
-    rpc_runtime_config.update_type_registry(load_type_registry_preset("legacy"))
-    rpc_runtime_config.update_type_registry(custom_rpc_type_registry)
+    rpc_runtime_config = get_rpc_runtime_config(custom_rpc_type_registry)
     obj = rpc_runtime_config.create_scale_object(return_type, scale_bytes)
     if obj.data.to_hex() == "0x0400":  # RPC returned None result
         return None
     return obj.decode()
 
 
+@lru_cache(maxsize=4096)
 def ss58_address_to_bytes(ss58_address: str) -> bytes:
-    """Converts a ss58 address to a bytes object."""
+    """Converts a ss58 address to a bytes object. Results are cached, as the mapping is deterministic."""
     account_id_hex: str = scalecodec.ss58_decode(ss58_address, SS58_FORMAT)
     return bytes.fromhex(account_id_hex)
 
@@ -402,7 +495,7 @@ def ss58_to_vec_u8(ss58_address: str) -> list[int]:
     :return: A list of integers representing the byte values of the SS58 address.
     """
     ss58_bytes: bytes = ss58_address_to_bytes(ss58_address)
-    encoded_address: list[int] = [int(byte) for byte in ss58_bytes]
+    encoded_address: list[int] = list(ss58_bytes)
     return encoded_address
 
 
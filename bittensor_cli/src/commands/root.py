@@ -1,6 +1,8 @@
 import asyncio
+from itertools import chain
 import json
-from typing import Optional, TYPE_CHECKING
+import sys
+from typing import Optional, Union
 
 from bittensor_wallet import Wallet
 import numpy as np
@@ -9,7 +11,6 @@ from rich import box
 from rich.prompt import Confirm
 from rich.table import Column, Table
 from rich.text import Text
-from scalecodec import GenericCall, ScaleType
 from substrateinterface.exceptions import SubstrateRequestException
 import typer
 
@@ -17,10 +18,10 @@ from bittensor_cli.src import DelegatesDetails
 from bittensor_cli.src.bittensor.balances import Balance
 from bittensor_cli.src.bittensor.chain_data import (
     DelegateInfo,
-    NeuronInfoLite,
     decode_account_id,
 )
 from bittensor_cli.src.bittensor.extrinsics.root import (
+    get_limits,
     root_register_extrinsic,
     set_root_weights_extrinsic,
 )
@@ -29,7 +30,10 @@ from bittensor_cli.src.commands.wallets import (
     set_id,
     set_id_prompts,
 )
-from bittensor_cli.src.bittensor.subtensor_interface import SubtensorInterface
+from bittensor_cli.src.bittensor.subtensor_interface import (
+    ProposalVoteData,
+    SubtensorInterface,
+)
 from bittensor_cli.src.bittensor.utils import (
     console,
     convert_weight_uids_and_vals_to_tensor,
@@ -44,8 +48,25 @@ from bittensor_cli.src.bittensor.utils import (
     unlock_key,
 )
 
-if TYPE_CHECKING:
-    from bittensor_cli.src.bittensor.subtensor_interface import ProposalVoteData
+# (header, Column kwargs) of the `root_list` table. Columns are built per table, as rich stores the cells in them.
+_ROOT_TABLE_COLUMNS = (
+    ("[bold white]UID", {"style": "dark_orange", "no_wrap": True}),
+    ("[bold white]NAME", {"style": "bright_cyan", "no_wrap": True}),
+    ("[bold white]ADDRESS", {"style": "bright_magenta", "no_wrap": True}),
+    (
+        "[bold white]STAKE(\u03c4)",
+        {"justify": "right", "style": "light_goldenrod2", "no_wrap": True},
+    ),
+    ("[bold white]SENATOR", {"style": "dark_sea_green", "no_wrap": True}),
+)
+
+_DELEGATE_PROMPT = (
+    "\n[bold blue]Current stake[/bold blue]: [blue]{stake}[/blue]\n"
+    "[bold white]Do you want to {verb}:[/bold white]\n"
+    "  [bold red]amount[/bold red]: [red]{amount}\n[/red]"
+    "  [bold yellow]{direction} hotkey[/bold yellow]: [yellow]{hotkey}\n[/yellow]"
+    "  [bold green]hotkey owner[/bold green]: [green]{owner}[/green]"
+)
 
 # helpers
 
@@ -53,28 +74,25 @@ if TYPE_CHECKING:
 def display_votes(
     vote_data: "ProposalVoteData", delegate_info: dict[str, DelegatesDetails]
 ) -> str:
-    vote_list = list()
+    def name_of(address: str) -> str:
+        delegate = delegate_info.get(address)
+        return delegate.display if delegate is not None else address
 
-    for address in vote_data.ayes:
-        vote_list.append(
-            "{}: {}".format(
-                delegate_info[address].display if address in delegate_info else address,
-                "[bold green]Aye[/bold green]",
-            )
-        )
+    aye_lines = (f"{name_of(a)}: [bold green]Aye[/bold green]" for a in vote_data.ayes)
+    nay_lines = (f"{name_of(a)}: [bold red]Nay[/bold red]" for a in vote_data.nays)
+    return "\n".join(chain(aye_lines, nay_lines))
 
-    for address in vote_data.nays:
-        vote_list.append(
-            "{}: {}".format(
-                delegate_info[address].display if address in delegate_info else address,
-                "[bold red]Nay[/bold red]",
-            )
-        )
 
-    return "\n".join(vote_list)
+def _format_tao(tao: float) -> str:
+    """Formats a tao amount exactly as `str(Balance.from_tao(tao))`, without building the Balance."""
+    return f"{Balance.unit}{int(tao * pow(10, 9)) / pow(10, 9):,.9f}"
 
 
 def format_call_data(call_data: dict) -> str:
+    """
+    Formats a proposal's call data as `call_function(arg, ...)`. This is a single, non-recursive pass:
+    nested call arguments are rendered with `str` rather than being walked.
+    """
     # Extract the module and call details
     module, call_details = next(iter(call_data.items()))
 
@@ -91,6 +109,7 @@ def format_call_data(call_data: dict) -> str:
     # Format the final output string
     return f"{call_function}({formatted_args})"
 
+
 async def _get_delegate_senate(
     subtensor: SubtensorInterface, block_hash: Optional[str] = None
 ) -> list[str]:
@@ -108,6 +127,7 @@ async def _get_delegate_senate(
         err_console.print("Unable to retrieve delegate senate members.")
         return []
 
+
 async def _get_expert_senate(
     subtensor: SubtensorInterface, block_hash: Optional[str] = None
 ) -> list[str]:
@@ -125,6 +145,7 @@ async def _get_expert_senate(
         err_console.print("Unable to retrieve expert senate members.")
         return []
 
+
 async def _get_all_senate_members(
     subtensor: SubtensorInterface, block_hash: Optional[str] = None
 ) -> list[str]:
@@ -132,28 +153,20 @@ async def _get_all_senate_members(
     Gets all members of the senate on the given subtensor's network
 
     :param subtensor: SubtensorInterface object to use for the query
+    :param block_hash: the hash of the block to query at, defaults to the chain head
 
     :return: list of the senate members' ss58 addresses
     """
-    
-    delegate_senate = await _get_delegate_senate(subtensor, block_hash)
-    expert_senate   = await _get_expert_senate(subtensor, block_hash)
-
+    delegate_senate, expert_senate = await asyncio.gather(
+        _get_delegate_senate(subtensor, block_hash),
+        _get_expert_senate(subtensor, block_hash),
+    )
     return delegate_senate + expert_senate
 
 
 async def _get_proposals(
     subtensor: SubtensorInterface, block_hash: str
 ) -> dict[str, tuple[dict, "ProposalVoteData"]]:
-    async def get_proposal_call_data(p_hash: str) -> Optional[GenericCall]:
-        proposal_data = await subtensor.substrate.query(
-            module="Triumvirate",
-            storage_function="ProposalOf",
-            block_hash=block_hash,
-            params=[p_hash],
-        )
-        return proposal_data
-
     ph = await subtensor.substrate.query(
         module="Triumvirate",
         storage_function="Proposals",
@@ -169,14 +182,41 @@ async def _get_proposals(
         err_console.print("Unable to retrieve proposal vote data")
         return {}
 
-    call_data_, vote_data_ = await asyncio.gather(
-        asyncio.gather(*[get_proposal_call_data(h) for h in proposal_hashes]),
-        asyncio.gather(*[subtensor.get_vote_data(h) for h in proposal_hashes]),
-    )
-    return {
-        proposal_hash: (cd, vd)
-        for cd, vd, proposal_hash in zip(call_data_, vote_data_, proposal_hashes)
+    if not proposal_hashes:
+        return {}
+
+    # fetch the call data and vote data of every proposal in a single storage request.
+    # Once the runtime for the block is loaded, building the keys needs no further RPC, so
+    # they are created in order rather than as 2N concurrent tasks all racing to load it.
+    await subtensor.substrate.init_runtime(block_hash=block_hash)
+    call_data_keys = [
+        await subtensor.substrate.create_storage_key(
+            "Triumvirate", "ProposalOf", [h], block_hash=block_hash
+        )
+        for h in proposal_hashes
+    ]
+    vote_data_keys = [
+        await subtensor.substrate.create_storage_key(
+            "Triumvirate", "Voting", [h], block_hash=block_hash
+        )
+        for h in proposal_hashes
+    ]
+    results = {
+        storage_key.to_hex(): value
+        for storage_key, value in await subtensor.substrate.query_multi(
+            call_data_keys + vote_data_keys, block_hash=block_hash
+        )
     }
+    proposals = {}
+    for proposal_hash, cd_key, vd_key in zip(
+        proposal_hashes, call_data_keys, vote_data_keys
+    ):
+        vote_data = results.get(vd_key.to_hex())
+        proposals[proposal_hash] = (
+            results.get(cd_key.to_hex()),
+            ProposalVoteData(vote_data) if vote_data is not None else None,
+        )
+    return proposals
 
 
 def _validate_proposal_hash(proposal_hash: str) -> bool:
@@ -186,7 +226,9 @@ def _validate_proposal_hash(proposal_hash: str) -> bool:
         return True
 
 
-async def _is_senate_member(subtensor: SubtensorInterface, hotkey_ss58: str) -> bool:
+async def _is_senate_member(
+    subtensor: SubtensorInterface, hotkey_ss58: str, block_hash: Optional[str] = None
+) -> bool:
     """
     Checks if a given neuron (identified by its hotkey SS58 address) is a member of the Bittensor senate.
     The senate is a key governance body within the Bittensor network, responsible for overseeing and
@@ -194,6 +236,7 @@ async def _is_senate_member(subtensor: SubtensorInterface, hotkey_ss58: str) ->
 
     :param subtensor: SubtensorInterface object to use for the query
     :param hotkey_ss58: The `SS58` address of the neuron's hotkey.
+    :param block_hash: the hash of the block to check membership at, defaults to the chain head
 
     :return: `True` if the neuron is a senate member at the given block, `False` otherwise.
 
@@ -201,12 +244,58 @@ async def _is_senate_member(subtensor: SubtensorInterface, hotkey_ss58: str) ->
     identifying the neurons that hold decision-making power within the network.
     """
 
-    senate_members = await _get_all_senate_members(subtensor)
+    senate_members = await _get_all_senate_members(subtensor, block_hash)
 
-    if not hasattr(senate_members, "count"):
-        return False
+    return hotkey_ss58 in set(senate_members)
 
-    return senate_members.count(hotkey_ss58) > 0
+
+def _normalize_hash(hash_: Union[str, bytes, list, tuple]) -> str:
+    """
+    Converts a hash from an event's attributes to a lowercase, `0x`-prefixed hex string.
+    """
+    if isinstance(hash_, str):
+        hash_ = hash_.lower()
+        return hash_ if hash_.startswith("0x") else f"0x{hash_}"
+    return f"0x{bytes(hash_).hex()}"
+
+
+def _has_voted_event(events: list, hotkey_ss58: str, proposal_hash: str) -> bool:
+    """
+    Checks the events triggered by a vote extrinsic for a Triumvirate `Voted` event cast by `hotkey_ss58`
+    on `proposal_hash`.
+
+    :param events: the extrinsic receipt's triggered events
+    :param hotkey_ss58: the ss58 address of the voting hotkey
+    :param proposal_hash: the hash of the proposal voted on
+
+    :return: `True` if a matching `Voted` event was emitted
+    """
+    proposal_hash = _normalize_hash(proposal_hash)
+    for event in events:
+        if (
+            event["event"]["module_id"] != "Triumvirate"
+            or event["event"]["event_id"] != "Voted"
+        ):
+            continue
+        attributes = event["event"]["attributes"]
+        if isinstance(attributes, dict):
+            account = attributes.get("account")
+            event_proposal_hash = attributes.get("proposal_hash")
+        else:
+            account, event_proposal_hash = attributes[0], attributes[1]
+        try:
+            if _normalize_hash(event_proposal_hash) != proposal_hash:
+                continue
+        except (TypeError, ValueError):
+            continue
+        try:
+            if decode_account_id(account) == hotkey_ss58:
+                return True
+        except (TypeError, ValueError):
+            # the account is already an ss58 string
+            if account == hotkey_ss58:
+                return True
+    return False
 
 
 async def vote_senate_extrinsic(
@@ -236,6 +325,8 @@ async def vote_senate_extrinsic(
              finalization/inclusion, the response is `True`.
     """
 
+    hotkey_ss58 = wallet.hotkey.ss58_address
+
     if prompt:
         # Prompt user for confirmation.
         if not Confirm.ask(f"Cast a vote of {vote}?"):
@@ -246,36 +337,42 @@ async def vote_senate_extrinsic(
             call_module="SubtensorModule",
             call_function="vote",
             call_params={
-                "hotkey": wallet.hotkey.ss58_address,
+                "hotkey": hotkey_ss58,
                 "proposal": proposal_hash,
                 "index": proposal_idx,
                 "approve": vote,
             },
         )
-        success, err_msg = await subtensor.sign_and_send_extrinsic(
+        (
+            success,
+            err_msg,
+            receipt,
+        ) = await subtensor.sign_and_send_extrinsic_with_receipt(
             call, wallet, wait_for_inclusion, wait_for_finalization
         )
         if not success:
             err_console.print(f":cross_mark: [red]Failed[/red]: {err_msg}")
             await asyncio.sleep(0.5)
             return False
-        # Successful vote, final check for data
+        # Successful vote, final check for data: the receipt's `Voted` event if we waited for the block,
+        # the proposal's vote data otherwise
+        if receipt is not None and receipt.block_hash:
+            has_voted = _has_voted_event(
+                await receipt.triggered_events, hotkey_ss58, proposal_hash
+            )
+        elif vote_data := await subtensor.get_vote_data(proposal_hash):
+            has_voted = hotkey_ss58 in set(vote_data.ayes) | set(vote_data.nays)
         else:
-            if vote_data := await subtensor.get_vote_data(proposal_hash):
-                if (
-                    vote_data.ayes.count(wallet.hotkey.ss58_address) > 0
-                    or vote_data.nays.count(wallet.hotkey.ss58_address) > 0
-                ):
-                    console.print(":white_heavy_check_mark: [green]Vote cast.[/green]")
-                    return True
-                else:
-                    # hotkey not found in ayes/nays
-                    err_console.print(
-                        ":cross_mark: [red]Unknown error. Couldn't find vote.[/red]"
-                    )
-                    return False
-            else:
-                return False
+            return False
+        if has_voted:
+            console.print(":white_heavy_check_mark: [green]Vote cast.[/green]")
+            return True
+        else:
+            # hotkey not found in ayes/nays
+            err_console.print(
+                ":cross_mark: [red]Unknown error. Couldn't find vote.[/red]"
+            )
+            return False
 
 
 async def burned_register_extrinsic(
@@ -307,20 +404,25 @@ async def burned_register_extrinsic(
 
     if not unlock_key(wallet).success:
         return False
+    hotkey_ss58 = wallet.hotkey.ss58_address
 
     with console.status(
         f":satellite: Checking Account on [bold]subnet:{netuid}[/bold]...",
         spinner="aesthetic",
     ) as status:
+        block_hash = await subtensor.substrate.get_chain_head()
         my_uid = await subtensor.substrate.query(
-            "SubtensorModule", "Uids", [netuid, wallet.hotkey.ss58_address]
+            "SubtensorModule",
+            "Uids",
+            [netuid, hotkey_ss58],
+            block_hash=block_hash,
         )
 
         print_verbose("Checking if already registered", status)
         neuron = await subtensor.neuron_for_uid(
             uid=my_uid,
             netuid=netuid,
-            block_hash=subtensor.substrate.last_block_hash,
+            block_hash=block_hash,
         )
 
         if not neuron.is_null:
@@ -341,7 +443,7 @@ async def burned_register_extrinsic(
             call_function="burned_register",
             call_params={
                 "netuid": netuid,
-                "hotkey": wallet.hotkey.ss58_address,
+                "hotkey": hotkey_ss58,
             },
         )
         success, err_msg = await subtensor.sign_and_send_extrinsic(
@@ -357,22 +459,23 @@ async def burned_register_extrinsic(
         with console.status(":satellite: Checking Balance...", spinner="aesthetic"):
             block_hash = await subtensor.substrate.get_chain_head()
             new_balance, netuids_for_hotkey, my_uid = await asyncio.gather(
-                subtensor.get_balance(
+                subtensor.get_balance_for_coldkey(
                     wallet.coldkeypub.ss58_address,
                     block_hash=block_hash,
                     reuse_block=False,
                 ),
-                subtensor.get_netuids_for_hotkey(
-                    wallet.hotkey.ss58_address, block_hash=block_hash
-                ),
+                subtensor.get_netuids_for_hotkey(hotkey_ss58, block_hash=block_hash),
                 subtensor.substrate.query(
-                    "SubtensorModule", "Uids", [netuid, wallet.hotkey.ss58_address]
+                    "SubtensorModule",
+                    "Uids",
+                    [netuid, hotkey_ss58],
+                    block_hash=block_hash,
                 ),
             )
 
         console.print(
             "Balance:\n"
-            f"  [blue]{old_balance}[/blue] :arrow_right: [green]{new_balance[wallet.coldkey.ss58_address]}[/green]"
+            f"  [blue]{old_balance}[/blue] :arrow_right: [green]{new_balance}[/green]"
         )
 
         if len(netuids_for_hotkey) > 0:
@@ -508,8 +611,14 @@ async def delegate_extrinsic(
              the response is `True`.
     """
 
-    async def _do_delegation(staking_balance_: Balance) -> tuple[bool, str]:
-        """Performs the delegation extrinsic call to the chain."""
+    async def _do_delegation(
+        staking_balance_: Balance,
+    ) -> tuple[bool, str, Optional[str]]:
+        """
+        Performs the delegation extrinsic call to the chain.
+
+        :return: (success, error message, hash of the block the extrinsic was included in, if waited for)
+        """
         if delegate:
             call = await subtensor.substrate.compose_call(
                 call_module="SubtensorModule",
@@ -528,9 +637,14 @@ async def delegate_extrinsic(
                     "amount_unstaked": staking_balance_.rao,
                 },
             )
-        return await subtensor.sign_and_send_extrinsic(
+        (
+            success,
+            err_msg,
+            receipt,
+        ) = await subtensor.sign_and_send_extrinsic_with_receipt(
             call, wallet, wait_for_inclusion, wait_for_finalization
         )
+        return success, err_msg, receipt.block_hash if receipt else None
 
     async def get_hotkey_owner(ss58: str, block_hash_: str):
         """Returns the coldkey owner of the passed hotkey."""
@@ -544,23 +658,12 @@ async def delegate_extrinsic(
         )
         return decode_account_id(_result[0])
 
-    async def get_stake_for_coldkey_and_hotkey(
-        hotkey_ss58: str, coldkey_ss58: str, block_hash_: str
-    ):
-        """Returns the stake under a coldkey - hotkey pairing."""
-        _result = await subtensor.substrate.query(
-            module="SubtensorModule",
-            storage_function="Stake",
-            params=[hotkey_ss58, coldkey_ss58],
-            block_hash=block_hash_,
-        )
-        return Balance.from_rao(_result or 0)
-
     delegate_string = "delegate" if delegate else "undelegate"
 
     # Decrypt key
     if not unlock_key(wallet).success:
         return False
+    coldkey_ss58 = wallet.coldkeypub.ss58_address
 
     print_verbose("Checking if hotkey is a delegate")
     if not await subtensor.is_hotkey_delegate(delegate_ss58):
@@ -575,23 +678,21 @@ async def delegate_extrinsic(
         print_verbose("Fetching balance, stake, and ownership", status)
         initial_block_hash = await subtensor.substrate.get_chain_head()
         (
-            my_prev_coldkey_balance_,
+            my_prev_coldkey_balance,
             delegate_owner,
             my_prev_delegated_stake,
         ) = await asyncio.gather(
-            subtensor.get_balance(
-                wallet.coldkey.ss58_address, block_hash=initial_block_hash
+            subtensor.get_balance_for_coldkey(
+                coldkey_ss58, block_hash=initial_block_hash
             ),
             get_hotkey_owner(delegate_ss58, block_hash_=initial_block_hash),
-            get_stake_for_coldkey_and_hotkey(
-                coldkey_ss58=wallet.coldkeypub.ss58_address,
+            subtensor.get_stake_for_coldkey_and_hotkey(
+                coldkey_ss58=coldkey_ss58,
                 hotkey_ss58=delegate_ss58,
-                block_hash_=initial_block_hash,
+                block_hash=initial_block_hash,
             ),
         )
 
-    my_prev_coldkey_balance = my_prev_coldkey_balance_[wallet.coldkey.ss58_address]
-
     # Convert to bittensor.Balance
     if amount is None:
         # Stake it all.
@@ -625,7 +726,7 @@ async def delegate_extrinsic(
         return False
 
     if delegate:
-        # Grab the existential deposit.
+        # Grab the existential deposit (a runtime constant, cached at the chain head).
         existential_deposit = await subtensor.get_existential_deposit()
 
         # Remove existential balance to keep key alive.
@@ -637,11 +738,14 @@ async def delegate_extrinsic(
     # Ask before moving on.
     if prompt:
         if not Confirm.ask(
-            f"\n[bold blue]Current stake[/bold blue]: [blue]{my_prev_delegated_stake}[/blue]\n"
-            f"[bold white]Do you want to {delegate_string}:[/bold white]\n"
-            f"  [bold red]amount[/bold red]: [red]{staking_balance}\n[/red]"
-            f"  [bold yellow]{'to' if delegate_string == 'delegate' else 'from'} hotkey[/bold yellow]: [yellow]{delegate_ss58}\n[/yellow]"
-            f"  [bold green]hotkey owner[/bold green]: [green]{delegate_owner}[/green]"
+            _DELEGATE_PROMPT.format(
+                stake=my_prev_delegated_stake,
+                verb=delegate_string,
+                amount=staking_balance,
+                direction="to" if delegate else "from",
+                hotkey=delegate_ss58,
+                owner=delegate_owner,
+            )
         ):
             return False
 
@@ -650,7 +754,7 @@ async def delegate_extrinsic(
         spinner="aesthetic",
     ) as status:
         print_verbose("Transmitting delegate operation call")
-        staking_response, err_msg = await _do_delegation(staking_balance)
+        staking_response, err_msg, block_hash = await _do_delegation(staking_balance)
 
     if staking_response is True:  # If we successfully staked.
         # We only wait here if we expect finalization.
@@ -663,21 +767,20 @@ async def delegate_extrinsic(
             spinner="aesthetic",
         ) as status:
             print_verbose("Fetching balance and stakes", status)
-            block_hash = await subtensor.substrate.get_chain_head()
+            # the extrinsic's block already reflects the new state
+            block_hash = block_hash or await subtensor.substrate.get_chain_head()
             new_balance, new_delegate_stake = await asyncio.gather(
-                subtensor.get_balance(
-                    wallet.coldkey.ss58_address, block_hash=block_hash
-                ),
-                get_stake_for_coldkey_and_hotkey(
-                    coldkey_ss58=wallet.coldkeypub.ss58_address,
+                subtensor.get_balance_for_coldkey(coldkey_ss58, block_hash=block_hash),
+                subtensor.get_stake_for_coldkey_and_hotkey(
+                    coldkey_ss58=coldkey_ss58,
                     hotkey_ss58=delegate_ss58,
-                    block_hash_=block_hash,
+                    block_hash=block_hash,
                 ),
             )
 
         console.print(
             "Balance:\n"
-            f"  [blue]{my_prev_coldkey_balance}[/blue] :arrow_right: [green]{new_balance[wallet.coldkey.ss58_address]}[/green]\n"
+            f"  [blue]{my_prev_coldkey_balance}[/blue] :arrow_right: [green]{new_balance}[/green]\n"
             "Stake:\n"
             f"  [blue]{my_prev_delegated_stake}[/blue] :arrow_right: [green]{new_delegate_stake}[/green]"
         )
@@ -734,18 +837,17 @@ async def root_list(subtensor: SubtensorInterface):
     """List the root network"""
 
     async def _get_list() -> tuple:
-        sm = await _get_all_senate_members(subtensor)
-
-        rn: list[NeuronInfoLite] = await subtensor.neurons_lite(netuid=0)
+        block_hash = await subtensor.substrate.get_chain_head()
+        sm, rn, di = await asyncio.gather(
+            _get_all_senate_members(subtensor, block_hash),
+            subtensor.neurons_lite(netuid=0, block_hash=block_hash),
+            subtensor.get_delegate_identities(block_hash),
+        )
         if not rn:
             return [], [], {}, {}
 
-        di: dict[str, DelegatesDetails] = await subtensor.get_delegate_identities()
-        ts: dict[str, ScaleType] = await subtensor.substrate.query_multiple(
-            [n.hotkey for n in rn],
-            module="SubtensorModule",
-            storage_function="TotalHotkeyStake",
-            reuse_block_hash=True,
+        ts: dict[str, Balance] = await subtensor.get_total_stake_for_hotkey(
+            *[n.hotkey for n in rn], block_hash=block_hash
         )
         return sm, rn, di, ts
 
@@ -754,40 +856,16 @@ async def root_list(subtensor: SubtensorInterface):
         spinner="aesthetic",
     ):
         senate_members, root_neurons, delegate_info, total_stakes = await _get_list()
-        total_tao = sum(
-            float(Balance.from_rao(total_stakes[neuron.hotkey]))
-            for neuron in root_neurons
-        )
+        # convert all stakes to tao in one vectorized pass, for the total, the sorting and the rows
+        stakes = np.fromiter(
+            (total_stakes[neuron.hotkey].rao for neuron in root_neurons),
+            dtype=np.int64,
+            count=len(root_neurons),
+        ) / pow(10, 9)
+        total_tao = stakes.sum()
 
         table = Table(
-            Column(
-                "[bold white]UID",
-                style="dark_orange",
-                no_wrap=True,
-                footer=f"[bold]{len(root_neurons)}[/bold]",
-            ),
-            Column(
-                "[bold white]NAME",
-                style="bright_cyan",
-                no_wrap=True,
-            ),
-            Column(
-                "[bold white]ADDRESS",
-                style="bright_magenta",
-                no_wrap=True,
-            ),
-            Column(
-                "[bold white]STAKE(\u03c4)",
-                justify="right",
-                style="light_goldenrod2",
-                no_wrap=True,
-                footer=f"{total_tao:.2f} (\u03c4) ",
-            ),
-            Column(
-                "[bold white]SENATOR",
-                style="dark_sea_green",
-                no_wrap=True,
-            ),
+            *[Column(header, **kwargs) for header, kwargs in _ROOT_TABLE_COLUMNS],
             title=f"[underline dark_orange]Root Network[/underline dark_orange]\n[dark_orange]Network {subtensor.network}",
             show_footer=True,
             show_edge=False,
@@ -795,6 +873,8 @@ async def root_list(subtensor: SubtensorInterface):
             border_style="bright_black",
             leading=True,
         )
+        table.columns[0].footer = f"[bold]{len(root_neurons)}[/bold]"
+        table.columns[3].footer = f"{total_tao:.2f} (\u03c4) "
 
         if not root_neurons:
             err_console.print(
@@ -802,23 +882,19 @@ async def root_list(subtensor: SubtensorInterface):
             )
             raise typer.Exit()
 
-        sorted_root_neurons = sorted(
-            root_neurons,
-            key=lambda neuron: float(Balance.from_rao(total_stakes[neuron.hotkey])),
-            reverse=True,
-        )
+        # highest stake first, ties keep their chain order
+        order = np.argsort(-stakes, kind="stable")
 
-    for neuron_data in sorted_root_neurons:
+    senate_set = frozenset(senate_members)
+    for idx in order:
+        neuron_data = root_neurons[idx]
+        hotkey = neuron_data.hotkey
         table.add_row(
             str(neuron_data.uid),
-            (
-                delegate_info[neuron_data.hotkey].display
-                if neuron_data.hotkey in delegate_info
-                else "~"
-            ),
-            neuron_data.hotkey,
-            "{:.5f}".format(float(Balance.from_rao(total_stakes[neuron_data.hotkey]))),
-            "Yes" if neuron_data.hotkey in senate_members else "No",
+            delegate_info[hotkey].display if hotkey in delegate_info else "~",
+            hotkey,
+            f"{stakes[idx]:.5f}",
+            "Yes" if hotkey in senate_set else "No",
         )
 
     return console.print(table)
@@ -832,8 +908,9 @@ async def set_weights(
     prompt: bool,
 ):
     """Set weights for root network."""
-    netuids_ = np.array(netuids, dtype=np.int64)
-    weights_ = np.array(weights, dtype=np.float32)
+    # lengths are validated by the CLI; build each typed array in a single allocation
+    netuids_ = np.fromiter(netuids, dtype=np.int64, count=len(netuids))
+    weights_ = np.fromiter(weights, dtype=np.float32, count=len(weights))
     console.print(f"Setting weights in [dark_orange]network: {subtensor.network}")
 
     # Run the set weights operation.
@@ -857,6 +934,7 @@ async def get_weights(
     reuse_last: bool,
     html_output: bool,
     no_cache: bool,
+    json_output: bool = False,
 ):
     """Get weights for root network."""
     if not reuse_last:
@@ -867,36 +945,22 @@ async def get_weights(
 
         uid_to_weights: dict[int, dict] = {}
         netuids = set()
-        for matrix in weights:
-            [uid, weights_data] = matrix
-
-            if not len(weights_data):
-                uid_to_weights[uid] = {}
-                normalized_weights = []
-            else:
-                normalized_weights = np.array(weights_data)[:, 1] / max(
-                    np.sum(weights_data, axis=0)[1], 1
-                )
-
-            for weight_data, normalized_weight in zip(weights_data, normalized_weights):
-                [netuid, _] = weight_data
-                netuids.add(netuid)
-                if uid not in uid_to_weights:
-                    uid_to_weights[uid] = {}
-
-                uid_to_weights[uid][netuid] = normalized_weight
+        for uid, weights_data in weights:
+            # rows are short, so normalize with plain Python arithmetic rather than
+            # building (and summing over both columns of) a NumPy array per uid
+            total = max(sum(weight for _, weight in weights_data), 1)
+            uid_weights = {netuid: weight / total for netuid, weight in weights_data}
+            uid_to_weights[uid] = uid_weights
+            netuids.update(uid_weights)
         rows: list[list[str]] = []
-        sorted_netuids: list = list(netuids)
-        sorted_netuids.sort()
-        for uid in uid_to_weights:
-            row = [str(uid)]
-
-            uid_weights = uid_to_weights[uid]
-            for netuid in sorted_netuids:
-                if netuid in uid_weights:
-                    row.append("{:0.2f}%".format(uid_weights[netuid] * 100))
-                else:
-                    row.append("~")
+        sorted_netuids: list = sorted(netuids)
+        # table column of each netuid, the first column being the uid
+        netuid_columns = {netuid: i for i, netuid in enumerate(sorted_netuids, 1)}
+        for uid, uid_weights in uid_to_weights.items():
+            # start from an all-empty row and fill in only the weights this uid has set
+            row = [str(uid)] + ["~"] * len(sorted_netuids)
+            for netuid, weight in uid_weights.items():
+                row[netuid_columns[netuid]] = f"{weight * 100:0.2f}%"
             rows.append(row)
 
         if not no_cache:
@@ -906,12 +970,24 @@ async def get_weights(
             create_table("rootgetweights", db_cols, rows)
             update_metadata_table(
                 "rootgetweights",
-                {"rows": json.dumps(rows), "netuids": json.dumps(sorted_netuids)},
+                {
+                    "rows": json.dumps(rows),
+                    "netuids": json.dumps(sorted_netuids),
+                    "weights": json.dumps(uid_to_weights),
+                },
             )
     else:
         metadata = get_metadata_table("rootgetweights")
         rows = json.loads(metadata["rows"])
         sorted_netuids = json.loads(metadata["netuids"])
+        if json_output and "weights" not in metadata:
+            err_console.print(
+                "The cached weights cannot be output as JSON. Run the command again "
+                "without --reuse-last."
+            )
+            return
+        # JSON object keys are strings, so uids and netuids come back as str here
+        uid_to_weights = json.loads(metadata.get("weights", "{}"))
 
     _min_lim = limit_min_col if limit_min_col is not None else 0
     _max_lim = limit_max_col + 1 if limit_max_col is not None else len(sorted_netuids)
@@ -921,6 +997,25 @@ async def get_weights(
         err_console.print("Minimum limit greater than number of netuids")
         return
 
+    shown_netuids = sorted_netuids[_min_lim:_max_lim]
+    if json_output:
+        # plain JSON for scripts: {uid: {netuid: weight}}, weights being fractions of 1
+        shown = {str(netuid) for netuid in shown_netuids}
+        sys.stdout.write(
+            json.dumps(
+                {
+                    str(uid): {
+                        str(netuid): weight
+                        for netuid, weight in uid_weights.items()
+                        if str(netuid) in shown
+                    }
+                    for uid, uid_weights in uid_to_weights.items()
+                }
+            )
+            + "\n"
+        )
+        return
+
     if not html_output:
         table = Table(
             show_footer=True,
@@ -936,7 +1031,7 @@ async def get_weights(
             style="rgb(50,163,219)",
             no_wrap=True,
         )
-        for netuid in sorted_netuids[_min_lim:_max_lim]:
+        for netuid in shown_netuids:
             table.add_column(
                 f"[white]{netuid}",
                 header_style="overline white",
@@ -952,14 +1047,13 @@ async def get_weights(
 
         # Adding rows
         for row in rows:
-            new_row = [row[0]] + row[_min_lim + 1 : _max_lim + 1]
-            table.add_row(*new_row)
+            table.add_row(row[0], *row[_min_lim + 1 : _max_lim + 1])
 
         return console.print(table)
 
     else:
         html_cols = [{"title": "UID", "field": "UID"}]
-        for netuid in sorted_netuids[_min_lim:_max_lim]:
+        for netuid in shown_netuids:
             html_cols.append({"title": str(netuid), "field": f"_{netuid}"})
         render_table(
             "rootgetweights",
@@ -967,28 +1061,32 @@ async def get_weights(
             html_cols,
         )
 
-UID    = int
+
+UID = int
 Weight = float
 
+
 async def _get_my_weights(
-    subtensor: SubtensorInterface, ss58_address: str, my_uid: str
+    subtensor: SubtensorInterface,
+    ss58_address: str,
+    my_uid: str,
+    block_hash: Optional[str] = None,
 ) -> dict[UID, Weight]:
     """Retrieves the weight array for a given hotkey SS58 address."""
 
     my_weights_ = await subtensor.substrate.query(
-        "SubtensorModule", "Weights", [0, my_uid], reuse_block_hash=True
-    )
-
-    my_weights: list[tuple[int, int]] = (
-        my_weights_ if my_weights_ is not None else []
+        "SubtensorModule",
+        "Weights",
+        [0, my_uid],
+        block_hash=block_hash,
+        reuse_block_hash=True,
     )
 
-    print_verbose("Fetching current weights")
-    for u, w in enumerate(my_weights):
-        if w: print_verbose(f"uid: {u}, weight: {w}")
+    my_weights: list[tuple[int, int]] = my_weights_ if my_weights_ is not None else []
 
-    weights = map(lambda t: (t[0], float(t[1])), my_weights)
-    return dict(weights)
+    weights = {netuid: float(weight) for netuid, weight in my_weights}
+    print_verbose(f"Current weights of uid {my_uid}: {weights}")
+    return weights
 
 
 async def set_boost(
@@ -1001,8 +1099,13 @@ async def set_boost(
     """Boosts weight of a given netuid for root network."""
     console.print(f"Boosting weights in [dark_orange]network: {subtensor.network}")
     print_verbose(f"Fetching uid of hotkey on root: {wallet.hotkey_str}")
+    # read the uid and its weights at the same block
+    block_hash = await subtensor.substrate.get_chain_head()
     my_uid = await subtensor.substrate.query(
-        "SubtensorModule", "Uids", [0, wallet.hotkey.ss58_address]
+        "SubtensorModule",
+        "Uids",
+        [0, wallet.hotkey.ss58_address],
+        block_hash=block_hash,
     )
 
     if my_uid is None:
@@ -1010,10 +1113,20 @@ async def set_boost(
         return False
 
     print_verbose("Fetching current weights")
-    my_weights      = await _get_my_weights(subtensor, wallet.hotkey.ss58_address, my_uid)
-    prev_weights    = my_weights.copy()
-    prev_weigth     = my_weights.get(netuid, 0)
-    new_weight      = prev_weigth + amount
+    # fetch the weight limits at the same block, for the extrinsic's checks
+    my_weights, limits = await asyncio.gather(
+        _get_my_weights(subtensor, wallet.hotkey.ss58_address, my_uid, block_hash),
+        get_limits(subtensor, block_hash),
+    )
+    prev_weigth = my_weights.get(netuid, 0)
+    new_weight = prev_weigth + amount
+
+    if new_weight == prev_weigth:
+        # set_root_weights replaces the whole vector: unchanged weights, nothing to submit
+        console.print(
+            f"Weight for netuid {netuid} is already {new_weight}, nothing to set"
+        )
+        return False
 
     my_weights[netuid] = new_weight
 
@@ -1023,9 +1136,6 @@ async def set_boost(
     console.print(
         f"Boosting weight for netuid {netuid}\n\tfrom {prev_weigth} to {new_weight}\n"
     )
-    console.print(
-        f"Previous weights -> Raw weights: \n\t{prev_weights} -> \n\t{my_weights}"
-    )
 
     print_verbose(f"All netuids: {netuids}")
     await set_root_weights_extrinsic(
@@ -1037,6 +1147,8 @@ async def set_boost(
         wait_for_inclusion=True,
         wait_for_finalization=True,
         prompt=prompt,
+        block_hash=block_hash,
+        limits=limits,
     )
 
 
@@ -1050,18 +1162,33 @@ async def set_slash(
     """Slashes weight"""
     console.print(f"Slashing weights in [dark_orange]network: {subtensor.network}")
     print_verbose(f"Fetching uid of hotkey on root: {wallet.hotkey_str}")
+    # read the uid and its weights at the same block
+    block_hash = await subtensor.substrate.get_chain_head()
     my_uid = await subtensor.substrate.query(
-        "SubtensorModule", "Uids", [0, wallet.hotkey.ss58_address]
+        "SubtensorModule",
+        "Uids",
+        [0, wallet.hotkey.ss58_address],
+        block_hash=block_hash,
     )
     if my_uid is None:
         err_console.print("Your hotkey is not registered to the root network")
         return False
 
     print_verbose("Fetching current weights")
-    my_weights      = await _get_my_weights(subtensor, wallet.hotkey.ss58_address, my_uid)
-    prev_weights    = my_weights.copy()
-    prev_weigth     = my_weights.get(netuid, 0)
-    new_weight      = max(0, prev_weigth -  amount) # Ensure weights don't go negative
+    # fetch the weight limits at the same block, for the extrinsic's checks
+    my_weights, limits = await asyncio.gather(
+        _get_my_weights(subtensor, wallet.hotkey.ss58_address, my_uid, block_hash),
+        get_limits(subtensor, block_hash),
+    )
+    prev_weigth = my_weights.get(netuid, 0)
+    new_weight = max(0, prev_weigth - amount)  # Ensure weights don't go negative
+
+    if new_weight == prev_weigth:
+        # set_root_weights replaces the whole vector: unchanged weights, nothing to submit
+        console.print(
+            f"Weight for netuid {netuid} is already {new_weight}, nothing to set"
+        )
+        return False
 
     my_weights[netuid] = new_weight
 
@@ -1071,9 +1198,6 @@ async def set_slash(
     console.print(
         f"Slashing weight for netuid {netuid}\n\tfrom {prev_weigth} to {new_weight}\n"
     )
-    console.print(
-        f"Previous weights -> Raw weights: \n\t{prev_weights} -> \n\t{my_weights}"
-    )
 
     await set_root_weights_extrinsic(
         subtensor=subtensor,
@@ -1084,6 +1208,8 @@ async def set_slash(
         wait_for_inclusion=True,
         wait_for_finalization=True,
         prompt=prompt,
+        block_hash=block_hash,
+        limits=limits,
     )
 
 
@@ -1108,22 +1234,29 @@ async def senate_vote(
         return False
 
     print_verbose(f"Fetching senate status of {wallet.hotkey_str}")
-    if not await _is_senate_member(subtensor, hotkey_ss58=wallet.hotkey.ss58_address):
+    console.print(f"Fetching proposals in [dark_orange]network: {subtensor.network}")
+    # the membership and the proposal are independent reads of the same block
+    block_hash = await subtensor.substrate.get_chain_head()
+    is_member, vote_data = await asyncio.gather(
+        _is_senate_member(
+            subtensor, hotkey_ss58=wallet.hotkey.ss58_address, block_hash=block_hash
+        ),
+        subtensor.get_vote_data(proposal_hash, block_hash=block_hash),
+    )
+    if not is_member:
         err_console.print(
             f"Aborting: Hotkey {wallet.hotkey.ss58_address} isn't a senate member."
         )
         return False
 
-    # Unlock the wallet.
-    if not unlock_key(wallet).success and unlock_key(wallet, "hot").success:
-        return False
-
-    console.print(f"Fetching proposals in [dark_orange]network: {subtensor.network}")
-    vote_data = await subtensor.get_vote_data(proposal_hash, reuse_block=True)
     if not vote_data:
         err_console.print(":cross_mark: [red]Failed[/red]: Proposal not found.")
         return False
 
+    # Unlock the wallet.
+    if not unlock_key(wallet).success and unlock_key(wallet, "hot").success:
+        return False
+
     success = await vote_senate_extrinsic(
         subtensor=subtensor,
         wallet=wallet,
@@ -1146,12 +1279,12 @@ async def get_senate(subtensor: SubtensorInterface):
     ) as status:
         print_verbose("Fetching senate members", status)
         delegate_senate = await _get_delegate_senate(subtensor)
-        expert_senate   = await _get_expert_senate(subtensor)
+        expert_senate = await _get_expert_senate(subtensor)
 
     print_verbose("Fetching member details from Github")
-    delegate_info: dict[
-        str, DelegatesDetails
-    ] = await subtensor.get_delegate_identities()
+    delegate_info: dict[str, DelegatesDetails] = (
+        await subtensor.get_delegate_identities()
+    )
 
     table = Table(
         Column(
@@ -1185,7 +1318,7 @@ async def get_senate(subtensor: SubtensorInterface):
                 else "~"
             ),
             ss58_address,
-            "Delegate"
+            "Delegate",
         )
 
     for ss58_address in expert_senate:
@@ -1196,7 +1329,7 @@ async def get_senate(subtensor: SubtensorInterface):
                 else "~"
             ),
             ss58_address,
-            "Expert"
+            "Expert",
         )
 
     return console.print(table)
@@ -1211,19 +1344,13 @@ async def register(wallet: Wallet, subtensor: SubtensorInterface, prompt: bool):
 
     # Check current recycle amount
     print_verbose("Fetching recycle amount & balance")
-    recycle_call, balance_ = await asyncio.gather(
+    recycle_call, balance = await asyncio.gather(
         subtensor.get_hyperparameter(param_name="Burn", netuid=0, reuse_block=True),
-        subtensor.get_balance(wallet.coldkeypub.ss58_address, reuse_block=True),
+        subtensor.get_balance_for_coldkey(
+            wallet.coldkeypub.ss58_address, reuse_block=True
+        ),
     )
     current_recycle = Balance.from_rao(int(recycle_call))
-    try:
-        balance: Balance = balance_[wallet.coldkeypub.ss58_address]
-    except TypeError as e:
-        err_console.print(f"Unable to retrieve current recycle. {e}")
-        return False
-    except KeyError:
-        err_console.print("Unable to retrieve current balance.")
-        return False
 
     # Check balance is sufficient
     if balance < current_recycle:
@@ -1265,9 +1392,9 @@ async def proposals(subtensor: SubtensorInterface):
     )
 
     print_verbose("Fetching member information from Chain")
-    registered_delegate_info: dict[
-        str, DelegatesDetails
-    ] = await subtensor.get_delegate_identities()
+    registered_delegate_info: dict[str, DelegatesDetails] = (
+        await subtensor.get_delegate_identities()
+    )
 
     table = Table(
         Column(
@@ -1406,20 +1533,29 @@ async def my_delegates(
 ):
     """Delegates stake to a chain delegate."""
 
-    async def wallet_to_delegates(
-        w: Wallet, bh: str
-    ) -> tuple[Optional[Wallet], Optional[list[tuple[DelegateInfo, Balance]]]]:
-        """Helper function to retrieve the validity of the wallet (if it has a coldkeypub on the device)
-        and its delegate info."""
-        if not w.coldkeypub_file.exists_on_device():
-            return None, None
-        else:
-            delegates_ = await subtensor.get_delegated(
-                w.coldkeypub.ss58_address, block_hash=bh
-            )
-            return w, delegates_
+    def get_wallets() -> list[Wallet]:
+        """Finds the wallets to list, keeping only those with a coldkeypub on the device."""
+        wallets_ = (
+            get_coldkey_wallets_for_path(wallet.path) if all_wallets else [wallet]
+        )
+        return [w for w in wallets_ if w.coldkeypub_file.exists_on_device()]
+
+    async def get_delegated_per_wallet() -> (
+        tuple[list[Wallet], list[list[tuple[DelegateInfo, Balance]]]]
+    ):
+        """Discovers the wallets on disk, off the event loop, then fetches their delegations."""
+        wallets_ = await asyncio.to_thread(get_wallets)
+        return wallets_, await asyncio.gather(
+            *[subtensor.get_delegated(w.coldkeypub.ss58_address) for w in wallets_]
+        )
 
-    wallets = get_coldkey_wallets_for_path(wallet.path) if all_wallets else [wallet]
+    print_verbose("Fetching delegate information")
+    # the identities don't depend on the wallets, so they are fetched alongside the wallet
+    # discovery and delegations
+    registered_delegate_info: dict[str, DelegatesDetails]
+    (wallets, delegates_per_wallet), registered_delegate_info = await asyncio.gather(
+        get_delegated_per_wallet(), subtensor.get_delegate_identities()
+    )
 
     table = Table(
         Column("[white]Wallet", style="bright_cyan"),
@@ -1480,75 +1616,61 @@ async def my_delegates(
     # TODO: this doesnt work when passed to wallets_with_delegates
     # block_hash = await subtensor.substrate.get_chain_head()
 
-    registered_delegate_info: dict[str, DelegatesDetails]
-    wallets_with_delegates: tuple[
-        tuple[Optional[Wallet], Optional[list[tuple[DelegateInfo, Balance]]]]
-    ]
-
-    print_verbose("Fetching delegate information")
-    wallets_with_delegates, registered_delegate_info = await asyncio.gather(
-        asyncio.gather(*[wallet_to_delegates(wallet_, None) for wallet_ in wallets]),
-        subtensor.get_delegate_identities(),
-    )
     if not registered_delegate_info:
         console.print(
             ":warning:[yellow]Could not get delegate info from chain.[/yellow]"
         )
 
     print_verbose("Processing delegate information")
-    for wall, delegates in wallets_with_delegates:
-        if not wall or not delegates:
+    for wall, delegates in zip(wallets, delegates_per_wallet):
+        if not delegates:
             continue
 
-        my_delegates_ = {}  # hotkey, amount
-        for delegate in delegates:
-            for coldkey_addr, staked in delegate[0].nominators:
-                if coldkey_addr == wall.coldkeypub.ss58_address and staked.tao > 0:
-                    my_delegates_[delegate[0].hotkey_ss58] = staked
-
-        delegates.sort(key=lambda d: d[0].total_stake, reverse=True)
-        total_delegated += sum(my_delegates_.values())
+        # get_delegated already pairs each delegate with this coldkey's stake on it, so only
+        # the delegates actually staked to are kept, sorted and shown
+        my_delegates_ = sorted(
+            ((delegate, staked) for delegate, staked in delegates if staked.tao > 0),
+            key=lambda pair: pair[0].total_stake,
+            reverse=True,
+        )
+        total_delegated += sum(staked for _, staked in my_delegates_)
+
+        for delegate, staked in my_delegates_:
+            hotkey = delegate.hotkey_ss58
+            if hotkey in registered_delegate_info:
+                delegate_name = registered_delegate_info[hotkey].display
+                delegate_url = registered_delegate_info[hotkey].web
+                delegate_description = registered_delegate_info[hotkey].additional
+            else:
+                delegate_name = "~"
+                delegate_url = ""
+                delegate_description = ""
 
-        for i, delegate in enumerate(delegates):
             owner_stake = next(
                 (
                     stake
-                    for owner, stake in delegate[0].nominators
-                    if owner == delegate[0].owner_ss58
+                    for owner, stake in delegate.nominators
+                    if owner == delegate.owner_ss58
                 ),
                 Balance.from_rao(0),  # default to 0 if no owner stake.
             )
-            if delegate[0].hotkey_ss58 in registered_delegate_info:
-                delegate_name = registered_delegate_info[
-                    delegate[0].hotkey_ss58
-                ].display
-                delegate_url = registered_delegate_info[delegate[0].hotkey_ss58].web
-                delegate_description = registered_delegate_info[
-                    delegate[0].hotkey_ss58
-                ].additional
-            else:
-                delegate_name = "~"
-                delegate_url = ""
-                delegate_description = ""
-
-            if delegate[0].hotkey_ss58 in my_delegates_:
-                twenty_four_hour = delegate[0].total_daily_return.tao * (
-                    my_delegates_[delegate[0].hotkey_ss58] / delegate[0].total_stake.tao
-                )
-                table.add_row(
-                    wall.name,
-                    Text(delegate_name, style=f"link {delegate_url}"),
-                    f"{delegate[0].hotkey_ss58}",
-                    f"{my_delegates_[delegate[0].hotkey_ss58]!s:13.13}",
-                    f"{twenty_four_hour!s:6.6}",
-                    str(len(delegate[0].nominators)),
-                    f"{owner_stake!s:13.13}",
-                    f"{delegate[0].total_stake!s:13.13}",
-                    group_subnets(delegate[0].registrations),
-                    group_subnets(delegate[0].validator_permits),
-                    f"{delegate[0].total_daily_return.tao * (1000 / (0.001 + delegate[0].total_stake.tao))!s:6.6}",
-                    str(delegate_description),
-                )
+            twenty_four_hour = delegate.total_daily_return.tao * (
+                staked / delegate.total_stake.tao
+            )
+            table.add_row(
+                wall.name,
+                Text(delegate_name, style=f"link {delegate_url}"),
+                f"{hotkey}",
+                f"{staked!s:13.13}",
+                f"{twenty_four_hour!s:6.6}",
+                str(len(delegate.nominators)),
+                f"{owner_stake!s:13.13}",
+                f"{delegate.total_stake!s:13.13}",
+                group_subnets(delegate.registrations),
+                group_subnets(delegate.validator_permits),
+                f"{delegate.total_daily_return.tao * (1000 / (0.001 + delegate.total_stake.tao))!s:6.6}",
+                str(delegate_description),
+            )
     if console.width < 150:
         console.print(
             "[yellow]Warning: Your terminal width might be too small to view all the information clearly"
@@ -1565,15 +1687,12 @@ async def list_delegates(subtensor: SubtensorInterface):
     ) as status:
         print_verbose("Fetching delegate details from chain", status)
         block_hash = await subtensor.substrate.get_chain_head()
-        registered_delegate_info, block_number, delegates = await asyncio.gather(
-            subtensor.get_delegate_identities(block_hash=block_hash),
-            subtensor.substrate.get_block_number(block_hash),
-            subtensor.get_delegates(block_hash=block_hash),
-        )
-
-        print_verbose("Fetching previous delegates info from chain", status)
 
         async def get_prev_delegates(fallback_offsets=(1200, 200)):
+            # the previous block only depends on the block number, so it is resolved and
+            # queried alongside the current delegates and identities
+            block_number = await subtensor.substrate.get_block_number(block_hash)
+            print_verbose("Fetching previous delegates info from chain", status)
             for offset in fallback_offsets:
                 try:
                     prev_block_hash = await subtensor.substrate.get_block_hash(
@@ -1584,7 +1703,11 @@ async def list_delegates(subtensor: SubtensorInterface):
                     continue
             return None
 
-        prev_delegates = await get_prev_delegates()
+        registered_delegate_info, delegates, prev_delegates = await asyncio.gather(
+            subtensor.get_delegate_identities(block_hash=block_hash),
+            subtensor.get_delegates(block_hash=block_hash),
+            get_prev_delegates(),
+        )
 
     if prev_delegates is None:
         err_console.print(
@@ -1672,14 +1795,15 @@ async def list_delegates(subtensor: SubtensorInterface):
     )
 
     for i, delegate in enumerate(delegates):
-        owner_stake = next(
-            (
-                stake
-                for owner, stake in delegate.nominators
-                if owner == delegate.owner_ss58
-            ),
-            Balance.from_rao(0),  # default to 0 if no owner stake.
-        )
+        daily_return = delegate.total_daily_return.tao
+        # one pass over the nominators for both the owner's stake and the nominator count
+        owner_stake = Balance.from_rao(0)  # default to 0 if no owner stake.
+        nominator_count = 0
+        for nominator, stake in delegate.nominators:
+            if nominator == delegate.owner_ss58:
+                owner_stake = stake
+            if stake.rao > 0:
+                nominator_count += 1
         if delegate.hotkey_ss58 in registered_delegate_info:
             delegate_name = registered_delegate_info[delegate.hotkey_ss58].display
             delegate_url = registered_delegate_info[delegate.hotkey_ss58].web
@@ -1724,7 +1848,7 @@ async def list_delegates(subtensor: SubtensorInterface):
             # SS58
             f"{delegate.hotkey_ss58}",
             # NOMINATORS
-            str(len([nom for nom in delegate.nominators if nom[1].rao > 0])),
+            str(nominator_count),
             # DELEGATE STAKE
             f"{owner_stake!s:13.13}",
             # TOTAL STAKE
@@ -1734,9 +1858,9 @@ async def list_delegates(subtensor: SubtensorInterface):
             # TAKE
             f"{delegate.take * 100:.1f}%",
             # NOMINATOR/(24h)/k
-            f"{Balance.from_tao(delegate.total_daily_return.tao * (1000 / (0.001 + delegate.total_stake.tao)))!s:6.6}",
+            f"{_format_tao(daily_return * (1000 / (0.001 + delegate.total_stake.tao))):6.6}",
             # DELEGATE/(24h)
-            f"{Balance.from_tao(delegate.total_daily_return.tao * 0.18) !s:6.6}",
+            f"{_format_tao(daily_return * 0.18):6.6}",
             # VPERMIT
             str(group_subnets(delegate.registrations)),
             # Desc
@@ -1770,16 +1894,8 @@ async def nominate(wallet: Wallet, subtensor: SubtensorInterface, prompt: bool):
         )
         return
     else:
-        # Check if we are a delegate.
-        print_verbose("Confirming delegate status")
-        is_delegate: bool = await subtensor.is_hotkey_delegate(
-            wallet.hotkey.ss58_address
-        )
-        if not is_delegate:
-            err_console.print(
-                f"Could not became a delegate on [white]{subtensor.network}[/white]"
-            )
-            return
+        # The call was included and succeeded, so become_delegate has been applied,
+        # and there is no need to fetch every delegate again to confirm it.
         console.print(
             f"Successfully became a delegate on [white]{subtensor.network}[/white]"
         )
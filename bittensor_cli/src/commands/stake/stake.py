@@ -239,7 +239,7 @@ async def add_stake_extrinsic(
         ):
             new_block_hash = await subtensor.substrate.get_chain_head()
             new_balance, new_stake = await asyncio.gather(
-                subtensor.get_balance(
+                subtensor.get_balance_for_coldkey(
                     wallet.coldkeypub.ss58_address, block_hash=new_block_hash
                 ),
                 subtensor.get_stake_for_coldkey_and_hotkey(
@@ -252,7 +252,7 @@ async def add_stake_extrinsic(
             console.print(
                 f"Balance:\n"
                 f"\t[blue]{old_balance}[/blue] :arrow_right: "
-                f"[green]{new_balance[wallet.coldkeypub.ss58_address]}[/green]"
+                f"[green]{new_balance}[/green]"
             )
             console.print(
                 f"Stake:\n"
@@ -419,17 +419,16 @@ async def add_stake_multiple_extrinsic(
             console.print(":white_heavy_check_mark: [green]Finalized[/green]")
 
             new_block_hash = await subtensor.substrate.get_chain_head()
-            new_stake, new_balance_ = await asyncio.gather(
+            new_stake, new_balance = await asyncio.gather(
                 subtensor.get_stake_for_coldkey_and_hotkey(
                     coldkey_ss58=wallet.coldkeypub.ss58_address,
                     hotkey_ss58=hotkey_ss58,
                     block_hash=new_block_hash,
                 ),
-                subtensor.get_balance(
+                subtensor.get_balance_for_coldkey(
                     wallet.coldkeypub.ss58_address, block_hash=new_block_hash
                 ),
             )
-            new_balance = new_balance_[wallet.coldkeypub.ss58_address]
             console.print(
                 "Stake ({}): [blue]{}[/blue] :arrow_right: [green]{}[/green]".format(
                     hotkey_ss58, old_stake, new_stake
@@ -449,10 +448,9 @@ async def add_stake_multiple_extrinsic(
         with console.status(
             f":satellite: Checking Balance on: ([white]{subtensor}[/white] ..."
         ):
-            new_balance_ = await subtensor.get_balance(
+            new_balance = await subtensor.get_balance_for_coldkey(
                 wallet.coldkeypub.ss58_address, reuse_block=False
             )
-            new_balance = new_balance_[wallet.coldkeypub.ss58_address]
         console.print(
             f"Balance: [blue]{old_balance}[/blue] :arrow_right: [green]{new_balance}[/green]"
         )
@@ -499,7 +497,7 @@ async def unstake_extrinsic(
         print_verbose("Fetching balance and stake", status)
         block_hash = await subtensor.substrate.get_chain_head()
         old_balance, old_stake, hotkey_owner = await asyncio.gather(
-            subtensor.get_balance(
+            subtensor.get_balance_for_coldkey(
                 wallet.coldkeypub.ss58_address, block_hash=block_hash
             ),
             subtensor.get_stake_for_coldkey_and_hotkey(
@@ -578,7 +576,7 @@ async def unstake_extrinsic(
         ):
             new_block_hash = await subtensor.substrate.get_chain_head()
             new_balance, new_stake = await asyncio.gather(
-                subtensor.get_balance(
+                subtensor.get_balance_for_coldkey(
                     wallet.coldkeypub.ss58_address, block_hash=new_block_hash
                 ),
                 subtensor.get_stake_for_coldkey_and_hotkey(
@@ -587,8 +585,7 @@ async def unstake_extrinsic(
             )
             console.print(
                 f"Balance:\n"
-                f"  [blue]{old_balance[wallet.coldkeypub.ss58_address]}[/blue] :arrow_right:"
-                f" [green]{new_balance[wallet.coldkeypub.ss58_address]}[/green]"
+                f"  [blue]{old_balance}[/blue] :arrow_right: [green]{new_balance}[/green]"
             )
             console.print(
                 f"Stake:\n  [blue]{old_stake}[/blue] :arrow_right: [green]{new_stake}[/green]"
@@ -662,7 +659,7 @@ async def unstake_multiple_extrinsic(
     ):
         block_hash = await subtensor.substrate.get_chain_head()
 
-        old_balance_ = subtensor.get_balance(
+        old_balance_ = subtensor.get_balance_for_coldkey(
             wallet.coldkeypub.ss58_address, block_hash=block_hash
         )
         old_stakes_ = asyncio.gather(
@@ -802,10 +799,12 @@ async def unstake_multiple_extrinsic(
         with console.status(
             f":satellite: Checking balance on: ([white]{subtensor}[/white] ..."
         ):
-            new_balance = await subtensor.get_balance(wallet.coldkeypub.ss58_address)
+            new_balance = await subtensor.get_balance_for_coldkey(
+                wallet.coldkeypub.ss58_address
+            )
         console.print(
-            f"Balance: [blue]{old_balance[wallet.coldkeypub.ss58_address]}[/blue]"
-            f" :arrow_right: [green]{new_balance[wallet.coldkeypub.ss58_address]}[/green]"
+            f"Balance: [blue]{old_balance}[/blue]"
+            f" :arrow_right: [green]{new_balance}[/green]"
         )
         return True
 
@@ -838,16 +837,14 @@ async def show(
         wallet_stake_accounts = {}
 
         # Get this wallet's coldkey balance.
-        cold_balance_, stakes_from_hk, stakes_from_d = await asyncio.gather(
-            subtensor.get_balance(
+        cold_balance, stakes_from_hk, stakes_from_d = await asyncio.gather(
+            subtensor.get_balance_for_coldkey(
                 wallet_.coldkeypub.ss58_address, block_hash=block_hash
             ),
             get_stakes_from_hotkeys(wallet_, block_hash=block_hash),
             get_stakes_from_delegates(wallet_),
         )
 
-        cold_balance = cold_balance_[wallet_.coldkeypub.ss58_address]
-
         # Populate the stake accounts with local hotkeys data.
         wallet_stake_accounts.update(stakes_from_hk)
 
@@ -1204,11 +1201,10 @@ async def stake_add(
     try:
         # Get coldkey balance
         print_verbose("Fetching coldkey balance")
-        wallet_balance_: dict[str, Balance] = await subtensor.get_balance(
+        wallet_balance: Balance = await subtensor.get_balance_for_coldkey(
             wallet.coldkeypub.ss58_address
         )
         block_hash = subtensor.substrate.last_block_hash
-        wallet_balance: Balance = wallet_balance_[wallet.coldkeypub.ss58_address]
         old_balance = copy.copy(wallet_balance)
         final_hotkeys: list[tuple[Optional[str], str]] = []
         final_amounts: list[Union[float, Balance]] = []
@@ -82,8 +82,9 @@ async def register_subnetwork_extrinsic(
         return [-1]
 
     print_verbose("Fetching balance")
-    your_balance_ = await subtensor.get_balance(wallet.coldkeypub.ss58_address)
-    your_balance = your_balance_[wallet.coldkeypub.ss58_address]
+    your_balance = await subtensor.get_balance_for_coldkey(
+        wallet.coldkeypub.ss58_address
+    )
 
     print_verbose("Fetching lock_cost")
     burn_cost = await lock_cost(subtensor)
@@ -427,16 +428,17 @@ async def register(
 
     # Check current recycle amount
     print_verbose("Fetching recycle amount")
-    current_recycle_, balance_ = await asyncio.gather(
+    current_recycle_, balance = await asyncio.gather(
         subtensor.get_hyperparameter(
             param_name="Burn", netuid=netuid, block_hash=block_hash
         ),
-        subtensor.get_balance(wallet.coldkeypub.ss58_address, block_hash=block_hash),
+        subtensor.get_balance_for_coldkey(
+            wallet.coldkeypub.ss58_address, block_hash=block_hash
+        ),
     )
     current_recycle = (
         Balance.from_rao(int(current_recycle_)) if current_recycle_ else Balance(0)
     )
-    balance = balance_[wallet.coldkeypub.ss58_address]
 
     # Check balance is sufficient
     if balance < current_recycle:
@@ -226,11 +226,8 @@ def _get_coldkey_ss58_addresses_for_path(path: str) -> tuple[list[str], list[str
     """Get all coldkey ss58 addresses from path."""
 
     abs_path = os.path.abspath(os.path.expanduser(path))
-    wallets = [
-        name
-        for name in os.listdir(abs_path)
-        if os.path.isdir(os.path.join(abs_path, name))
-    ]
+    with os.scandir(abs_path) as entries:
+        wallets = [entry.name for entry in entries if entry.is_dir()]
     coldkey_paths = [
         os.path.join(abs_path, wallet, "coldkeypub.txt")
         for wallet in wallets
@@ -340,7 +337,6 @@ async def wallet_balance(
         str(total_free_balance + total_staked_balance),
     )
     console.print(Padding(table, (0, 0, 0, 4)))
-    await subtensor.substrate.close()
 
 
 async def get_wallet_transfers(wallet_address: str) -> list[dict]:
@@ -555,12 +551,8 @@ async def _get_total_balance(
             coldkey_wallet.coldkeypub_file.exists_on_device()
             and not coldkey_wallet.coldkeypub_file.is_encrypted()
         ):
-            total_balance = sum(
-                (
-                    await subtensor.get_balance(
-                        coldkey_wallet.coldkeypub.ss58_address, block_hash=block_hash
-                    )
-                ).values()
+            total_balance = await subtensor.get_balance_for_coldkey(
+                coldkey_wallet.coldkeypub.ss58_address, block_hash=block_hash
             )
         if not coldkey_wallet.coldkeypub_file.exists_on_device():
             return [], None
@@ -1025,25 +1017,24 @@ def _get_hotkeys(
 ) -> list[Wallet]:
     """Filters a set of hotkeys (all_hotkeys) based on whether they are included or excluded."""
 
-    def is_hotkey_matched(wallet: Wallet, item: str) -> bool:
-        if is_valid_ss58_address(item):
-            return wallet.hotkey.ss58_address == item
-        else:
-            return wallet.hotkey_str == item
+    # Classify each item once, rather than re-validating every item for every wallet.
+    ss58_items: set[str] = set()
+    name_items: set[str] = set()
+    for item in include_hotkeys or exclude_hotkeys:
+        (ss58_items if is_valid_ss58_address(item) else name_items).add(item)
+
+    def is_hotkey_matched(wallet: Wallet) -> bool:
+        return wallet.hotkey_str in name_items or (
+            bool(ss58_items) and wallet.hotkey.ss58_address in ss58_items
+        )
 
     if include_hotkeys:
         # We are only showing hotkeys that are specified.
-        all_hotkeys = [
-            hotkey
-            for hotkey in all_hotkeys
-            if any(is_hotkey_matched(hotkey, item) for item in include_hotkeys)
-        ]
+        all_hotkeys = [hotkey for hotkey in all_hotkeys if is_hotkey_matched(hotkey)]
     else:
         # We are excluding the specified hotkeys from all_hotkeys.
         all_hotkeys = [
-            hotkey
-            for hotkey in all_hotkeys
-            if not any(is_hotkey_matched(hotkey, item) for item in exclude_hotkeys)
+            hotkey for hotkey in all_hotkeys if not is_hotkey_matched(hotkey)
         ]
     return all_hotkeys
 
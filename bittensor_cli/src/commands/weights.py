@@ -9,7 +9,12 @@ from numpy.typing import NDArray
 from rich.prompt import Confirm
 from substrateinterface.exceptions import SubstrateRequestException
 
-from bittensor_cli.src.bittensor.utils import err_console, console, format_error_message
+from bittensor_cli.src.bittensor.utils import (
+    err_console,
+    console,
+    format_error_message,
+    u16_normalized_floats,
+)
 from bittensor_cli.src.bittensor.extrinsics.root import (
     convert_weights_and_uids_for_emit,
     generate_weight_hash,
@@ -68,7 +73,7 @@ class SetWeightsExtrinsic:
         )
 
         # Ask before moving on.
-        formatted_weight_vals = [float(v / 65535) for v in weight_vals]
+        formatted_weight_vals = u16_normalized_floats(weight_vals).tolist()
         if self.prompt and not Confirm.ask(
             f"Do you want to set weights:\n[bold white]"
             f"  weights: {formatted_weight_vals}\n  uids: {weight_uids}[/bold white ]?"
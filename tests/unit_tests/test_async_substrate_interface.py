@@ -0,0 +1,122 @@
+import asyncio
+import json
+
+import pytest
+from substrateinterface.exceptions import SubstrateRequestException
+
+from bittensor_cli.src.bittensor.async_substrate_interface import (
+    AsyncSubstrateInterface,
+    QueryCache,
+    Websocket,
+)
+
+
+class FakeConnection:
+    """Stands in for the websockets connection, replaying queued replies."""
+
+    def __init__(self, replies: list):
+        self.sent = []
+        self.replies = replies
+
+    async def send(self, data: str):
+        self.sent.append(json.loads(data))
+
+    async def recv(self) -> str:
+        return json.dumps(self.replies.pop(0))
+
+
+def test_query_cache_key():
+    # only results at a specific block are cached
+    assert QueryCache.make_key("System", "Account", ["a"], None) is None
+    assert QueryCache.make_key("System", "Account", ["a"], "0x01") == (
+        "System",
+        "Account",
+        ("a",),
+        "0x01",
+    )
+    # unhashable params are not cached
+    assert QueryCache.make_key("System", "Account", [["a"]], "0x01") is None
+
+
+def test_query_cache_lru_eviction():
+    cache = QueryCache(maxsize=2)
+    cache.add_item("a", 1)
+    cache.add_item("b", 2)
+    # retrieving "a" makes "b" the least recently used
+    assert cache.retrieve("a") == 1
+    cache.add_item("c", 3)
+    assert cache.retrieve("b") is None
+    assert cache.retrieve("a") == 1
+    assert cache.retrieve("c") == 3
+    # re-adding an existing key replaces it without evicting
+    cache.add_item("a", 4)
+    assert cache.retrieve("a") == 4
+    assert cache.retrieve("c") == 3
+
+
+def test_send_batch_demultiplexes_responses():
+    async def run():
+        ws = Websocket("ws://localhost")
+        ws.ws = FakeConnection(
+            # answered out of order, as a single array
+            [[{"id": 1, "result": "b"}, {"id": 0, "result": "a"}]]
+        )
+        ids = await ws.send_batch(
+            [{"method": "m", "params": []}, {"method": "n", "params": []}]
+        )
+        assert ids == [0, 1]
+        assert [item["id"] for item in ws.ws.sent[0]] == ids
+        await ws._recv()
+        assert (await ws.retrieve(0))["result"] == "a"
+        assert (await ws.retrieve(1))["result"] == "b"
+        assert ws._open_subscriptions == 0
+        assert not ws._pending_batch_ids
+
+    asyncio.run(run())
+
+
+def test_rejected_batch_fails_all_pending_ids():
+    async def run():
+        ws = Websocket("ws://localhost")
+        ws.ws = FakeConnection(
+            [{"jsonrpc": "2.0", "id": None, "error": {"message": "Batch too large"}}]
+        )
+        ids = await ws.send_batch(
+            [{"method": "m", "params": []}, {"method": "n", "params": []}]
+        )
+        await ws._recv()
+        for item_id in ids:
+            with pytest.raises(SubstrateRequestException, match="Batch too large"):
+                await asyncio.wait_for(ws.retrieve(item_id), timeout=1)
+        assert ws._open_subscriptions == 0
+        assert not ws._pending_batch_ids
+
+    asyncio.run(run())
+
+
+def test_get_events_filters_by_extrinsic_idx():
+    def event(phase: dict, event_id: str) -> dict:
+        return {
+            "phase": phase,
+            "event": {"System": ({event_id: {"info": "x"}},)},
+            "topics": (),
+        }
+
+    events = [
+        event({"ApplyExtrinsic": (0,)}, "ExtrinsicSuccess"),
+        event({"ApplyExtrinsic": (1,)}, "ExtrinsicFailed"),
+        event({"Finalization": ()}, "Finalized"),
+    ]
+
+    async def query(**kwargs):
+        return events
+
+    substrate = AsyncSubstrateInterface.__new__(AsyncSubstrateInterface)
+    substrate.query = query
+
+    filtered = asyncio.run(substrate.get_events("0x01", extrinsic_idx=1))
+    assert [e["event"]["event_id"] for e in filtered] == ["ExtrinsicFailed"]
+    assert filtered[0]["extrinsic_idx"] == 1
+
+    unfiltered = asyncio.run(substrate.get_events("0x01"))
+    assert [e["extrinsic_idx"] for e in unfiltered] == [0, 1, None]
@@ -0,0 +1,31 @@
+import numpy as np
+import pytest
+
+from bittensor_cli.src.bittensor.extrinsics.root import normalize_max_weight
+
+
+@pytest.mark.parametrize("dtype", [np.uint16, np.int64])
+def test_normalize_max_weight_integer_input(dtype):
+    # under the limit: plain normalization
+    x = np.array([1, 2, 3, 4], dtype=dtype)
+    weights = normalize_max_weight(x, limit=0.5)
+    assert weights.dtype == np.float64
+    np.testing.assert_allclose(weights, [0.1, 0.2, 0.3, 0.4])
+    # the input is left untouched
+    np.testing.assert_array_equal(x, [1, 2, 3, 4])
+
+    # over the limit: the largest weight is cut off
+    x = np.array([1, 1, 1, 10], dtype=dtype)
+    weights = normalize_max_weight(x, limit=0.4)
+    assert weights.dtype == np.float64
+    assert weights.sum() == pytest.approx(1)
+    assert weights.max() <= 0.4 + 1e-6
+    np.testing.assert_array_equal(x, [1, 1, 1, 10])
+
+
+def test_normalize_max_weight_keeps_float_dtype():
+    x = np.array([1, 2, 3, 4], dtype=np.float32)
+    weights = normalize_max_weight(x, limit=0.5)
+    assert weights.dtype == np.float32
+    assert weights is not x
+    np.testing.assert_allclose(weights, [0.1, 0.2, 0.3, 0.4], rtol=1e-6)
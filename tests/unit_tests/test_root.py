@@ -0,0 +1,113 @@
+import asyncio
+import json
+
+import pytest
+from scalecodec.utils.ss58 import ss58_encode
+
+from bittensor_cli.src.bittensor.balances import Balance
+from bittensor_cli.src.commands import root
+from bittensor_cli.src.commands.root import _format_tao, _has_voted_event
+
+HOTKEY_PUBKEY = bytes(range(32))
+HOTKEY = ss58_encode(HOTKEY_PUBKEY, 42)
+PROPOSAL_HASH = "0x" + "ab" * 32
+
+
+def voted_event(attributes, module_id: str = "Triumvirate", event_id="Voted"):
+    return {
+        "event": {
+            "module_id": module_id,
+            "event_id": event_id,
+            "attributes": attributes,
+        }
+    }
+
+
+@pytest.mark.parametrize(
+    "tao", [0, 1, 0.5, 1234567.891, 0.000000001, 1e-10, 21_000_000, 3.3333333333]
+)
+def test_format_tao(tao):
+    assert _format_tao(tao) == str(Balance.from_tao(tao))
+
+
+def test_has_voted_event():
+    # named attributes
+    assert _has_voted_event(
+        [voted_event({"account": HOTKEY, "proposal_hash": PROPOSAL_HASH})],
+        HOTKEY,
+        PROPOSAL_HASH,
+    )
+    # positional attributes, with the account and hash as raw bytes
+    assert _has_voted_event(
+        [voted_event([HOTKEY_PUBKEY, tuple(b"\xab" * 32), True, 1, 0])],
+        HOTKEY,
+        PROPOSAL_HASH,
+    )
+    # hashes are compared case-insensitively
+    assert _has_voted_event(
+        [voted_event([HOTKEY, PROPOSAL_HASH.upper().replace("0X", "0x")])],
+        HOTKEY,
+        PROPOSAL_HASH,
+    )
+
+
+def test_has_voted_event_ignores_unrelated_events():
+    other_hotkey = ss58_encode(bytes(32), 42)
+    events = [
+        # another pallet
+        voted_event(
+            {"account": HOTKEY, "proposal_hash": PROPOSAL_HASH}, module_id="Other"
+        ),
+        # another event
+        voted_event(
+            {"account": HOTKEY, "proposal_hash": PROPOSAL_HASH}, event_id="Closed"
+        ),
+        # another proposal
+        voted_event({"account": HOTKEY, "proposal_hash": "0x" + "cd" * 32}),
+        # another voter
+        voted_event({"account": other_hotkey, "proposal_hash": PROPOSAL_HASH}),
+    ]
+    assert not _has_voted_event(events, HOTKEY, PROPOSAL_HASH)
+    assert not _has_voted_event([], HOTKEY, PROPOSAL_HASH)
+
+
+def test_get_weights_json_output(monkeypatch, capsys):
+    class FakeSubtensor:
+        async def weights(self, netuid):
+            return [(0, [(1, 100), (3, 300)]), (5, [(3, 7)])]
+
+    metadata = {}
+    monkeypatch.setattr(root, "create_table", lambda *args: None)
+    monkeypatch.setattr(
+        root, "update_metadata_table", lambda table, values: metadata.update(values)
+    )
+    monkeypatch.setattr(root, "get_metadata_table", lambda table: metadata)
+
+    def get_weights(reuse_last: bool, limit_min_col=None) -> dict:
+        asyncio.run(
+            root.get_weights(
+                FakeSubtensor(),
+                limit_min_col=limit_min_col,
+                limit_max_col=None,
+                reuse_last=reuse_last,
+                html_output=False,
+                no_cache=False,
+                json_output=True,
+            )
+        )
+        return json.loads(capsys.readouterr().out)
+
+    expected = {"0": {"1": 0.25, "3": 0.75}, "5": {"3": 1.0}}
+    assert get_weights(reuse_last=False) == expected
+    # the cached weights give the same output
+    assert get_weights(reuse_last=True) == expected
+    # only the netuids within the column limits are output
+    assert get_weights(reuse_last=True, limit_min_col=1) == {
+        "0": {"3": 0.75},
+        "5": {"3": 1.0},
+    }
+
+    # caches written before the weights were stored can't be output as JSON
+    del metadata["weights"]
+    asyncio.run(root.get_weights(FakeSubtensor(), None, None, True, False, False, True))
+    assert capsys.readouterr().out == ""
@@ -0,0 +1,110 @@
+import asyncio
+import json
+import os
+import time
+
+import pytest
+
+from bittensor_cli.src import defaults
+from bittensor_cli.src.bittensor import subtensor_interface
+from bittensor_cli.src.bittensor.subtensor_interface import (
+    _get_github_delegates_details,
+)
+
+DETAILS = {"5Hotkey": {"name": "delegate", "url": "", "description": ""}}
+
+
+class FakeResponse:
+    def __init__(self, payload, ok: bool = True):
+        self.payload = payload
+        self.ok = ok
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        pass
+
+    async def json(self, content_type=None):
+        return self.payload
+
+
+def fake_session(payload, ok: bool = True, requests: list = None):
+    """Returns a stand-in for aiohttp.ClientSession, recording the requested urls."""
+
+    class FakeSession:
+        def __init__(self, timeout=None):
+            pass
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *args):
+            pass
+
+        def get(self, url):
+            if requests is not None:
+                requests.append(url)
+            return FakeResponse(payload, ok)
+
+    return FakeSession
+
+
+@pytest.fixture
+def cache_path(tmp_path, monkeypatch):
+    path = tmp_path / "delegates.json"
+    monkeypatch.setattr(defaults.delegates, "cache_path", str(path))
+    monkeypatch.setattr(subtensor_interface, "_github_delegates_cache", {})
+    return path
+
+
+def test_fresh_disk_cache_is_used(cache_path, monkeypatch):
+    cache_path.write_text(json.dumps(DETAILS))
+    requests = []
+    monkeypatch.setattr(
+        subtensor_interface.aiohttp,
+        "ClientSession",
+        fake_session({}, requests=requests),
+    )
+    assert asyncio.run(_get_github_delegates_details()) == DETAILS
+    assert not requests
+
+
+def test_stale_disk_cache_is_refetched(cache_path, monkeypatch):
+    cache_path.write_text(json.dumps({"old": {}}))
+    stale = time.time() - defaults.delegates.cache_ttl - 1
+    os.utime(cache_path, (stale, stale))
+    requests = []
+    monkeypatch.setattr(
+        subtensor_interface.aiohttp,
+        "ClientSession",
+        fake_session(DETAILS, requests=requests),
+    )
+    assert asyncio.run(_get_github_delegates_details()) == DETAILS
+    assert len(requests) == 1
+    # the cache file is replaced, without leaving the temporary file behind
+    assert json.loads(cache_path.read_text()) == DETAILS
+    assert os.listdir(cache_path.parent) == [cache_path.name]
+
+    # then served from memory
+    assert asyncio.run(_get_github_delegates_details()) == DETAILS
+    assert len(requests) == 1
+
+
+@pytest.mark.parametrize("content", ["[1, 2]", "{truncated"])
+def test_invalid_disk_cache_falls_back_to_fetch(cache_path, monkeypatch, content):
+    cache_path.write_text(content)
+    monkeypatch.setattr(
+        subtensor_interface.aiohttp, "ClientSession", fake_session(DETAILS)
+    )
+    assert asyncio.run(_get_github_delegates_details()) == DETAILS
+    assert json.loads(cache_path.read_text()) == DETAILS
+
+
+@pytest.mark.parametrize("payload, ok", [(DETAILS, False), ([1, 2], True)])
+def test_failed_fetch_is_not_cached(cache_path, monkeypatch, payload, ok):
+    monkeypatch.setattr(
+        subtensor_interface.aiohttp, "ClientSession", fake_session(payload, ok)
+    )
+    assert asyncio.run(_get_github_delegates_details()) is None
+    assert not cache_path.exists()
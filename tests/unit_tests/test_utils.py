@@ -0,0 +1,166 @@
+from bittensor_wallet import Wallet
+import pytest
+from scalecodec import ScaleBytes
+from scalecodec.utils.ss58 import ss58_encode
+
+from bittensor_cli.src.bittensor.utils import (
+    CachedRuntimeConfiguration,
+    decode_scale_bytes,
+    get_all_wallets_for_path,
+    get_coldkey_wallets_for_path,
+    get_hotkey_wallets_for_wallet,
+    get_rpc_runtime_config,
+    is_valid_bittensor_address_or_public_key,
+    is_valid_ed25519_pubkey,
+    is_valid_ss58_address,
+    is_valid_wallet,
+)
+
+PUBKEY = bytes(range(32))
+SS58_ADDRESS = ss58_encode(PUBKEY, 42)
+
+
+def test_get_rpc_runtime_config_reuses_config_per_registry():
+    registry = {"types": {"TestStruct": {"type": "struct", "type_mapping": []}}}
+    config = get_rpc_runtime_config(registry)
+    assert isinstance(config, CachedRuntimeConfiguration)
+    assert get_rpc_runtime_config(registry) is config
+    # an equal but distinct registry gets its own config
+    assert get_rpc_runtime_config({**registry}) is not config
+
+
+def test_cached_runtime_configuration_memoizes_decoder_class():
+    registry = {"types": {}}
+    config = get_rpc_runtime_config(registry)
+    decoder_class = config.get_decoder_class("Vec<u16>")
+    assert config.get_decoder_class("Vec<u16>") is decoder_class
+    # the shared class is re-attached to the config asking for it
+    other = get_rpc_runtime_config({"types": {}})
+    assert other.get_decoder_class("Vec<u16>").runtime_config is other
+    assert config.get_decoder_class("Vec<u16>").runtime_config is config
+
+    # updating the registry drops the memoized classes
+    config.update_type_registry({"types": {"Custom": "u8"}})
+    assert "Vec<u16>" not in config._decoder_classes
+
+
+def test_decode_scale_bytes():
+    registry = {"types": {}}
+    # Vec<u16> of [1, 2]
+    result = decode_scale_bytes("Vec<u16>", ScaleBytes("0x0801000200"), registry)
+    assert result == [1, 2]
+    # a None result
+    assert decode_scale_bytes("Vec<u8>", ScaleBytes("0x0400"), registry) is None
+
+
+def test_is_valid_ss58_address():
+    assert is_valid_ss58_address(SS58_ADDRESS)
+    # answered from the cache the second time
+    assert is_valid_ss58_address(SS58_ADDRESS)
+    assert not is_valid_ss58_address(SS58_ADDRESS[:-1])
+    assert not is_valid_ss58_address("")
+
+
+@pytest.mark.parametrize(
+    "address", [None, 42, [SS58_ADDRESS], {"address": SS58_ADDRESS}]
+)
+def test_validators_reject_unhashable_or_non_str_input(address):
+    # unhashable input must not reach the cache and raise
+    assert not is_valid_ss58_address(address)
+    assert not is_valid_ed25519_pubkey(address)
+    assert not is_valid_bittensor_address_or_public_key(address)
+    # bytes are never ss58 addresses
+    assert not is_valid_ss58_address(PUBKEY)
+
+
+@pytest.mark.parametrize(
+    "public_key",
+    [PUBKEY, PUBKEY.hex(), f"0x{PUBKEY.hex()}", f"0x{PUBKEY.hex().upper()}"],
+)
+def test_is_valid_ed25519_pubkey(public_key):
+    assert is_valid_ed25519_pubkey(public_key)
+
+
+@pytest.mark.parametrize(
+    "public_key",
+    [
+        PUBKEY[:-1],
+        PUBKEY + b"\x00",
+        f"0x{PUBKEY.hex()[:-2]}",
+        f"0x{PUBKEY.hex()}00",
+        f"00{PUBKEY.hex()}",
+        f"0x{'zz' * 32}",
+        "",
+    ],
+)
+def test_is_valid_ed25519_pubkey_rejects_malformed_keys(public_key):
+    assert not is_valid_ed25519_pubkey(public_key)
+
+
+@pytest.fixture
+def wallet_path(tmp_path) -> str:
+    """
+    A wallet path with wallets `a` (hotkeys `h1`, `h2`), `b` (hotkey `h1`) and `c` (no hotkeys), alongside
+    a directory without a coldkey and a stray file.
+    """
+    path = str(tmp_path / "wallets")
+    for name, hotkeys in (("a", ("h1", "h2")), ("b", ("h1",)), ("c", ())):
+        wallet = Wallet(name=name, path=path)
+        wallet.create_coldkey_from_uri(
+            f"//{name}", use_password=False, overwrite=True, suppress=True
+        )
+        for hotkey in hotkeys:
+            Wallet(name=name, hotkey=hotkey, path=path).create_hotkey_from_uri(
+                f"//{name}/{hotkey}", use_password=False, overwrite=True, suppress=True
+            )
+    (tmp_path / "wallets" / "a" / "hotkeys" / "not_a_hotkey").mkdir()
+    (tmp_path / "wallets" / "not_a_wallet").mkdir()
+    (tmp_path / "wallets" / "stray.txt").write_text("")
+    return path
+
+
+def test_get_all_wallets_for_path(wallet_path):
+    wallets = get_all_wallets_for_path(wallet_path)
+    # directories without a coldkeypub, and directories within hotkeys, are skipped
+    assert sorted((w.name, w.hotkey_str) for w in wallets) == [
+        ("a", "h1"),
+        ("a", "h2"),
+        ("b", "h1"),
+    ]
+    assert get_all_wallets_for_path(f"{wallet_path}/missing") == []
+
+
+def test_get_hotkey_wallets_for_wallet(wallet_path):
+    hotkeys = get_hotkey_wallets_for_wallet(Wallet(name="a", path=wallet_path))
+    assert sorted(w.hotkey_str for w in hotkeys) == ["h1", "h2"]
+    assert get_hotkey_wallets_for_wallet(Wallet(name="c", path=wallet_path)) == []
+
+
+def test_get_all_wallets_for_path_keeps_coldkey_order(wallet_path):
+    # the coldkeys are read in parallel, but their hotkeys are returned in the scan order
+    expected = [
+        (w.name, hotkey.hotkey_str)
+        for w in get_coldkey_wallets_for_path(wallet_path)
+        for hotkey in get_hotkey_wallets_for_wallet(w)
+    ]
+    wallets = get_all_wallets_for_path(wallet_path)
+    assert [(w.name, w.hotkey_str) for w in wallets] == expected
+
+
+def test_is_valid_wallet(wallet_path, tmp_path, monkeypatch):
+    cases = [
+        # (wallet name, hotkey, path, expected)
+        ("a", "h1", wallet_path, (True, True)),
+        ("c", "h1", wallet_path, (True, False)),
+        ("d", "h1", wallet_path, (False, False)),
+        ("a", "h1", f"{wallet_path}/missing", (False, False)),
+    ]
+    for name, hotkey, path, expected in cases:
+        assert is_valid_wallet(Wallet(name=name, hotkey=hotkey, path=path)) == expected
+
+    # the wallet path is expanded
+    monkeypatch.setenv("HOME", str(tmp_path))
+    assert is_valid_wallet(Wallet(name="a", hotkey="h2", path="~/wallets")) == (
+        True,
+        True,
+    )